@@ -2,15 +2,37 @@
 TradingGuard — JSON Bridge
 Manages the session.json file shared between the Python app and the MT5 EA.
 Uses file-level locking (msvcrt on Windows) to prevent read/write collisions.
+
+Design note: session state deliberately stays a plain JSON file rather than
+a SQLite table. The MQL5 EA (ea/TradingGuard.mq5 + JAson.mqh) reads and
+writes session.json directly through FileOpen() in the MT5 Common folder,
+and MQL5 has no SQLite driver available in that sandbox — so the JSON file
+IS the interprocess contract. Durable history lives in SQLite (app/database.py);
+this file only carries the live session handshake.
+
+The same contract rules out a fixed-size mmap'd region: the EA rewrites the
+file with FileOpen(FILE_WRITE), which truncates it (undefining any mapping
+held here), and JAson.mqh chokes on NUL padding. Reads stay cheap via the
+stat cache and the persistent handle instead.
 """
 
 import json
 import os
-import time
 import msvcrt
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from app.config import SESSION_JSON_PATH
 
+# orjson (C extension) parses/serializes several times faster than stdlib
+# json; fall back to stdlib so the app still runs without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Default state written when a new session starts or on reset
 _DEFAULT_SESSION = {
@@ -42,89 +64,357 @@ _DEFAULT_SESSION = {
 }
 
 
+# Key view used by read() to detect schema drift without copying the
+# defaults. In the common case the file already has every field and the
+# parsed dict can be returned as-is.
+_DEFAULT_KEYS = frozenset(_DEFAULT_SESSION)
+
+
+# How long update() coalesces writes before flushing to disk. Callers that
+# set several fields in quick succession (or UI widgets firing per keystroke)
+# collapse into a single locked read/merge/write cycle.
+_FLUSH_DELAY_S = 0.05
+
+
+# Size of the advisory lock region at offset 0. One byte is enough for
+# mutual exclusion (readers and writers all lock the same byte) and is far
+# cheaper for the kernel's byte-range lock bookkeeping than a 2 GB span.
+_LOCK_BYTES = 1
+
+
+@contextmanager
+def _file_lock(f, exclusive: bool):
+    """Hold the 1-byte advisory lock at offset 0 for the duration.
+
+    LK_LOCK/LK_RLCK block in the kernel (Windows retries internally for up
+    to ~10s); the 2-attempt loop only covers pathological longer waits.
+    """
+    lock_mode = msvcrt.LK_LOCK if exclusive else msvcrt.LK_RLCK
+    for attempt in range(2):
+        try:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), lock_mode, _LOCK_BYTES)
+            break
+        except OSError:
+            if attempt == 1:
+                raise
+    try:
+        yield
+    finally:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, _LOCK_BYTES)
+
+
+def _loads(content: bytes) -> dict:
+    """Parse the session payload (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize the session payload to bytes (orjson when available).
+
+    Compact form (no indent): ~2.4x fewer bytes for the EA to read and
+    parse on every tick. Pretty-print on demand with
+    ``python -m json.tool session.json`` when inspecting by hand.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# Pre-encoded default payload for reset(): the defaults are immutable, so
+# serialize them once at import with a placeholder and splice the current
+# timestamp in at reset time instead of re-serializing the whole dict.
+_TS_PLACEHOLDER = "@RESET-TS@"
+_DEFAULT_PREFIX, _DEFAULT_SUFFIX = _dumps(
+    {**_DEFAULT_SESSION, "timestamp": _TS_PLACEHOLDER}
+).split(_TS_PLACEHOLDER.encode("ascii"))
+
+
+@dataclass(slots=True)
+class SessionState:
+    """Typed view of the enforcement-relevant session fields.
+
+    The per-tick enforcement paths in the UI read a dozen fields each;
+    slotted attribute access replaces repeated string-keyed dict lookups
+    and boxes each value's coercion in one place. Widgets that render the
+    full payload keep the dict from read().
+    """
+
+    session_active: bool = False
+    trading_allowed: bool = False
+    shutdown_signal: bool = False
+    break_active: bool = False
+    break_until: str = ""
+    bias_set_at: str = ""
+    losses_since_bias: int = 0
+    bias_expired: bool = False
+    news_lock: bool = False
+    trades_today: int = 0
+    daily_loss_usd: float = 0.0
+    daily_profit_usd: float = 0.0
+    consecutive_losses: int = 0
+    last_trade_result: str = ""
+    last_trade_pnl: float = 0.0
+    ea_heartbeat: str = ""
+    timestamp: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionState":
+        """Build a state view from a read() dict, coercing defensively."""
+        return cls(
+            session_active=bool(data.get("session_active")),
+            trading_allowed=bool(data.get("trading_allowed")),
+            shutdown_signal=bool(data.get("shutdown_signal")),
+            break_active=bool(data.get("break_active")),
+            break_until=data.get("break_until") or "",
+            bias_set_at=data.get("bias_set_at") or "",
+            losses_since_bias=int(data.get("losses_since_bias", 0) or 0),
+            bias_expired=bool(data.get("bias_expired")),
+            news_lock=bool(data.get("news_lock")),
+            trades_today=int(data.get("trades_today", 0) or 0),
+            daily_loss_usd=float(data.get("daily_loss_usd", 0) or 0),
+            daily_profit_usd=float(data.get("daily_profit_usd", 0) or 0),
+            consecutive_losses=int(data.get("consecutive_losses", 0) or 0),
+            last_trade_result=(data.get("last_trade_result") or "").strip(),
+            last_trade_pnl=float(data.get("last_trade_pnl", 0) or 0),
+            ea_heartbeat=(data.get("ea_heartbeat") or "").strip(),
+            timestamp=(data.get("timestamp") or "").strip(),
+        )
+
+
 class SessionBridge:
     """Read / write the session.json bridge file with file-level locking."""
 
     def __init__(self, path: str = SESSION_JSON_PATH):
         self.path = path
+        # (st_mtime_ns, st_size, merged dict) of the last successful read.
+        # The GUI re-reads on change notifications and a fallback timer;
+        # when the file has not changed we can skip the lock + JSON parse.
+        self._cache: tuple[int, int, dict] | None = None
+        # One long-lived handle instead of open/close per operation: saves a
+        # CreateFile/CloseHandle pair per call and avoids the brief unlocked
+        # window between close and reopen. _io_lock serializes threads within
+        # this process sharing the fd position; msvcrt still locks across
+        # processes.
+        self._fh = None
+        self._io_lock = threading.Lock()
+        # Set once the directory + file are known to exist, after which the
+        # per-read exists/makedirs syscalls are skipped.
+        self._verified = False
+        # Fields queued by update() awaiting the debounced flush.
+        self._pending: dict = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        # Second-resolution timestamp cache: coalesced writes land within the
+        # same second, so most writes reuse the formatted string.
+        self._last_ts_int = -1
+        self._last_ts_str = ""
 
     # ── Public API ─────────────────────────────────────────────────────────
 
     def read(self) -> dict:
         """Return the current session state. Creates file if missing.
         Merges any missing default fields for backward compatibility."""
-        if not os.path.exists(self.path):
-            os.makedirs(os.path.dirname(self.path), exist_ok=True)
-            self.reset()
+        if not self._verified and not os.path.exists(self.path):
+            # Initialize the missing file without going through reset():
+            # reset() discards the pending update() buffer, which would drop
+            # fields queued by an update() that triggered this first read.
+            self._write(dict(_DEFAULT_SESSION))
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            st = None
+        if (
+            st is not None
+            and self._cache is not None
+            and self._cache[0] == st.st_mtime_ns
+            and self._cache[1] == st.st_size
+        ):
+            # Unchanged since last read — hand out a copy so callers that
+            # mutate the dict (e.g. update()) cannot corrupt the cache.
+            return self._overlay_pending(dict(self._cache[2]))
         data = self._locked_read()
-        merged = dict(_DEFAULT_SESSION)
-        merged.update(data)
-        return merged
+        if _DEFAULT_KEYS - data.keys():
+            merged = {**_DEFAULT_SESSION, **data}
+        else:
+            # No missing fields — skip the defaults copy entirely.
+            merged = data
+        if st is not None:
+            self._cache = (st.st_mtime_ns, st.st_size, dict(merged))
+        return self._overlay_pending(merged)
 
-    def write(self, data: dict) -> None:
-        """Overwrite the entire session file."""
-        data["timestamp"] = datetime.now().isoformat()
-        self._locked_write(data)
+    def write(self, data: dict) -> dict:
+        """Overwrite the entire session file and return the written state.
+
+        A full overwrite supersedes any fields still queued by update(),
+        so the pending buffer is dropped. Returning the stamped dict lets
+        callers avoid a paired read() of what was just written.
+        """
+        self._discard_pending()
+        return self._write(data)
 
     def update(self, **fields) -> dict:
-        """Merge *fields* into the current state and persist."""
+        """Merge *fields* into the current state and persist (debounced).
+
+        Consecutive calls within _FLUSH_DELAY_S coalesce into one locked
+        read/merge/write cycle. Returns the projected state immediately;
+        read() reflects queued fields, so read-after-update stays
+        consistent even before the flush lands on disk.
+        """
+        current = self.read()
+        changed = {k: v for k, v in fields.items() if current.get(k) != v}
+        if not changed:
+            # Every field already holds the requested value (common for
+            # widgets re-sending state) — no write needed.
+            return current
+        with self._pending_lock:
+            self._pending.update(changed)
+            if self._flush_timer is None:
+                timer = threading.Timer(_FLUSH_DELAY_S, self._flush_pending)
+                timer.daemon = True
+                self._flush_timer = timer
+                timer.start()
+        current.update(changed)
+        return current
+
+    def update_sync(self, **fields) -> dict:
+        """Merge *fields* and persist before returning (no debounce)."""
         data = self.read()
         data.update(fields)
         self.write(data)
         return data
 
     def reset(self) -> dict:
-        """Reset session.json to defaults."""
+        """Reset session.json to defaults (pre-encoded fast path)."""
+        self._discard_pending()
+        ts = self._now_iso()
+        self._cache = None
+        self._locked_write_bytes(_DEFAULT_PREFIX + ts.encode("ascii") + _DEFAULT_SUFFIX)
         data = dict(_DEFAULT_SESSION)
-        self.write(data)
+        data["timestamp"] = ts
         return data
 
+    def flush_to_disk(self) -> None:
+        """Force session.json down to stable storage.
+
+        Writes only flush to the OS page cache; callers invoke this on app
+        shutdown and from a periodic timer to bound data loss on power cut.
+        """
+        self._flush_pending()
+        try:
+            with self._io_lock:
+                os.fsync(self._get_fh().fileno())
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Flush queued fields and release the persistent file handle."""
+        self._flush_pending()
+        with self._io_lock:
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                except OSError:
+                    pass
+                self._fh = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # ── Debounced update machinery ─────────────────────────────────────────
+
+    def _overlay_pending(self, data: dict) -> dict:
+        """Apply fields queued by update() on top of the on-disk state."""
+        if self._pending:
+            with self._pending_lock:
+                data.update(self._pending)
+        return data
+
+    def _flush_pending(self) -> None:
+        """Write queued update() fields to disk in one cycle."""
+        with self._pending_lock:
+            fields = self._pending
+            self._pending = {}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if not fields:
+            return
+        data = self.read()
+        data.update(fields)
+        # Bypass write(): it would discard fields queued since the snapshot.
+        self._write(data)
+
+    def _write(self, data: dict) -> dict:
+        """Stamp and persist *data* without touching the pending buffer."""
+        data["timestamp"] = self._now_iso()
+        self._cache = None
+        self._locked_write(data)
+        return data
+
+    def _now_iso(self) -> str:
+        """Current ISO timestamp, cached at second resolution."""
+        t = int(time.time())
+        if t != self._last_ts_int:
+            self._last_ts_str = datetime.fromtimestamp(t).isoformat(timespec="seconds")
+            self._last_ts_int = t
+        return self._last_ts_str
+
+    def _discard_pending(self) -> None:
+        """Drop queued fields (a full write() supersedes them)."""
+        with self._pending_lock:
+            self._pending.clear()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
     # ── Internal helpers (Windows file locking) ────────────────────────────
 
     def _locked_read(self) -> dict:
-        self._ensure_file_exists()
-        with open(self.path, "r", encoding="utf-8") as f:
-            self._acquire_lock(f, exclusive=False)
-            try:
+        with self._io_lock:
+            f = self._get_fh()
+            with _file_lock(f, exclusive=False):
+                f.seek(0)
                 content = f.read()
-                return json.loads(content) if content.strip() else dict(_DEFAULT_SESSION)
-            finally:
-                self._release_lock(f)
+            return _loads(content) if content.strip() else dict(_DEFAULT_SESSION)
 
     def _locked_write(self, data: dict) -> None:
-        self._ensure_file_exists()
-        payload = json.dumps(data, indent=2)
-        with open(self.path, "r+", encoding="utf-8") as f:
-            self._acquire_lock(f, exclusive=True)
-            try:
+        self._locked_write_bytes(_dumps(data))
+
+    def _locked_write_bytes(self, payload: bytes) -> None:
+        with self._io_lock:
+            f = self._get_fh()
+            with _file_lock(f, exclusive=True):
                 f.seek(0)
                 f.truncate()
                 f.write(payload)
+                # flush() pushes the bytes to the OS page cache so the EA
+                # sees them immediately; the disk barrier is deferred to
+                # flush_to_disk() (shutdown + periodic timer) because the
+                # session file is advisory state — SQLite is the durable
+                # record — and a FlushFileBuffers per write dominated
+                # update() latency.
                 f.flush()
-                os.fsync(f.fileno())
-            finally:
-                self._release_lock(f)
+
+    def _get_fh(self):
+        """Return the persistent r+b handle, opening it on first use."""
+        if self._fh is None or self._fh.closed:
+            self._ensure_file_exists()
+            self._fh = open(self.path, "r+b")
+        return self._fh
 
     def _ensure_file_exists(self) -> None:
+        if self._verified:
+            return
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
         if not os.path.exists(self.path):
             with open(self.path, "w", encoding="utf-8") as f:
                 f.write("{}")
+        self._verified = True
 
-    @staticmethod
-    def _acquire_lock(file_obj, exclusive: bool, retries: int = 20, delay: float = 0.05) -> None:
-        lock_mode = msvcrt.LK_NBLCK if exclusive else msvcrt.LK_NBRLCK
-        for attempt in range(retries):
-            try:
-                file_obj.seek(0)
-                msvcrt.locking(file_obj.fileno(), lock_mode, 0x7FFFFFFF)
-                return
-            except OSError:
-                if attempt == retries - 1:
-                    raise
-                time.sleep(delay)
-
-    @staticmethod
-    def _release_lock(file_obj) -> None:
-        file_obj.seek(0)
-        msvcrt.locking(file_obj.fileno(), msvcrt.LK_UNLCK, 0x7FFFFFFF)
@@ -4,6 +4,7 @@ All constants, limits, and file paths used across the app.
 """
 
 import os
+from pathlib import Path
 
 # ─── Risk Limits ───────────────────────────────────────────────────────────────
 RISK_PER_TRADE_USD = 12.0       # Max loss per single trade ($)
@@ -54,12 +55,15 @@ NEWS_PROXY_URL = os.getenv("NEWS_PROXY_URL", "http://127.0.0.1:10808").strip()
 NEWS_TIME_OFFSET_MINUTES = int(os.getenv("NEWS_TIME_OFFSET_MINUTES", "0"))
 
 # ─── Paths ─────────────────────────────────────────────────────────────────────
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
 ANALYSIS_ASSETS_DIR = os.path.join(PROJECT_ROOT, "analysis_assets")
 
 # MT5 Common Data Folder — This is shared between ALL MT5 instances and accessible by Python
 # Path: %APPDATA%\MetaQuotes\Terminal\Common\Files
-MT5_COMMON_PATH = os.path.join(os.environ["APPDATA"], "MetaQuotes", "Terminal", "Common", "Files")
+# Fall back to ~/.config when APPDATA is unset so the module still imports
+# on non-Windows dev machines (tests, linting).
+_APPDATA = os.environ.get("APPDATA") or os.path.expanduser("~/.config")
+MT5_COMMON_PATH = os.path.join(_APPDATA, "MetaQuotes", "Terminal", "Common", "Files")
 SESSION_JSON_PATH = os.path.join(MT5_COMMON_PATH, "session.json")
 
 DB_PATH = os.path.join(PROJECT_ROOT, "tradingguard.db")
@@ -74,19 +78,39 @@ MT5_EXPERTS_PATH = (
 )
 
 # ─── Polling ───────────────────────────────────────────────────────────────────
-SESSION_POLL_INTERVAL_MS = 2000  # How often the app re-reads session.json (ms)
+# Primary session.json updates arrive via QFileSystemWatcher change
+# notifications; this timer is only a low-frequency fallback for events the
+# watcher can drop (e.g. atomic replace by an editor).
+SESSION_FALLBACK_POLL_INTERVAL_MS = 10000
 EA_HEARTBEAT_TIMEOUT_SECONDS = 20  # Max allowed age of EA heartbeat during active session
 
 # ─── Helper Functions ─────────────────────────────────────────────────────────
 from datetime import datetime, timedelta, date, timezone
 
+# Hoisted once at import: the helpers below run on every poll tick, so they
+# should not re-allocate the timezone/timedelta or redo minute arithmetic.
+TEHRAN_TZ = timezone(timedelta(hours=3, minutes=30))
+_TRADING_START_MIN = TRADING_START_HOUR * 60 + TRADING_START_MINUTE
+_TRADING_END_MIN = TRADING_END_HOUR * 60 + TRADING_END_MINUTE
+_BREAK_START_MIN = DAILY_BREAK_HOUR * 60 + DAILY_BREAK_MINUTE
+_BREAK_END_MIN = _BREAK_START_MIN + DAILY_BREAK_DURATION_MINUTES
+
+
+def _minute_mask(start_min: int, end_min: int) -> int:
+    """Bitmap over minute-of-day with bits [start_min, end_min) set."""
+    return ((1 << (end_min - start_min)) - 1) << start_min
+
+
+# Minute-of-day bitmaps: each window query collapses to a shift + AND, and
+# non-contiguous windows would just OR extra ranges into the mask.
+_TRADING_MASK = _minute_mask(_TRADING_START_MIN, _TRADING_END_MIN)
+_BREAK_MASK = _minute_mask(_BREAK_START_MIN, _BREAK_END_MIN)
+
 
 def get_tehran_now() -> datetime:
     """Current Tehran datetime using fixed UTC+3:30 offset."""
     # Keep return value naive for compatibility with existing code paths.
-    utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
-    tehran_offset = timedelta(hours=3, minutes=30)
-    return utc_now + tehran_offset
+    return datetime.now(TEHRAN_TZ).replace(tzinfo=None)
 
 
 def get_session_day() -> date:
@@ -96,28 +120,32 @@ def get_session_day() -> date:
     previous trading day for lock/history consistency.
     """
     tehran_now = get_tehran_now()
-    start_minutes = TRADING_START_HOUR * 60 + TRADING_START_MINUTE
     current_minutes = tehran_now.hour * 60 + tehran_now.minute
-    if current_minutes < start_minutes:
+    if current_minutes < _TRADING_START_MIN:
         return (tehran_now - timedelta(days=1)).date()
     return tehran_now.date()
 
 
+# (ordinal, iso string) of the last formatted session day: the key is asked
+# for on every poll tick but only changes at the 11:00 rollover.
+_session_day_cache = [0, ""]
+
+
 def get_session_day_str() -> str:
-    """Session day key in ISO format (YYYY-MM-DD)."""
-    return get_session_day().isoformat()
+    """Session day key in ISO format (YYYY-MM-DD), cached per day."""
+    day = get_session_day()
+    o = day.toordinal()
+    if o != _session_day_cache[0]:
+        _session_day_cache[0] = o
+        _session_day_cache[1] = day.isoformat()
+    return _session_day_cache[1]
 
 def is_within_trading_hours() -> bool:
     """Check if current time is within trading hours (Tehran time).
     Tehran is UTC+3:30.
     """
     tehran_now = get_tehran_now()
-    
-    start_minutes = TRADING_START_HOUR * 60 + TRADING_START_MINUTE
-    end_minutes = TRADING_END_HOUR * 60 + TRADING_END_MINUTE
-    current_minutes = tehran_now.hour * 60 + tehran_now.minute
-    
-    return start_minutes <= current_minutes < end_minutes
+    return bool(_TRADING_MASK >> (tehran_now.hour * 60 + tehran_now.minute) & 1)
 
 
 def is_daily_break_time() -> tuple[bool, str]:
@@ -125,12 +153,7 @@ def is_daily_break_time() -> tuple[bool, str]:
     Returns (is_break_time, reason).
     """
     tehran_now = get_tehran_now()
-    
-    current_minutes = tehran_now.hour * 60 + tehran_now.minute
-    break_start = DAILY_BREAK_HOUR * 60 + DAILY_BREAK_MINUTE
-    break_end = break_start + DAILY_BREAK_DURATION_MINUTES
-    
-    if break_start <= current_minutes < break_end:
+    if _BREAK_MASK >> (tehran_now.hour * 60 + tehran_now.minute) & 1:
         return True, f"Daily break ({DAILY_BREAK_HOUR}:{DAILY_BREAK_MINUTE:02d} Tehran)"
     return False, ""
 
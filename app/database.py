@@ -5,92 +5,465 @@ SQLite-backed storage for daily P&L and session history.
 
 import json
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from app.config import DB_PATH, get_session_day_str
 
+# orjson en/decodes the analysis JSON blobs several times faster than
+# stdlib json; optional, as in app.bridge.
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_text(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_text(obj) -> str:
+        return json.dumps(obj, ensure_ascii=True, separators=(",", ":"))
+
+
+# Full DDL in one blob: executescript parses it in a single C pass, which
+# matters for test suites that instantiate DailyDatabase repeatedly.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_results (
+    date       TEXT PRIMARY KEY,
+    pnl        INTEGER NOT NULL DEFAULT 0,  -- cents; converted at the API boundary
+    trades     INTEGER NOT NULL DEFAULT 0,
+    result     TEXT NOT NULL DEFAULT 'flat'
+);
+
+CREATE TABLE IF NOT EXISTS trade_events (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_date   TEXT NOT NULL,
+    trade_index  INTEGER NOT NULL,
+    result       TEXT NOT NULL DEFAULT 'unknown',
+    pnl          REAL,
+    recorded_at  INTEGER NOT NULL,
+    UNIQUE(trade_date, trade_index)
+);
+
+CREATE TABLE IF NOT EXISTS trade_ledger (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_date    TEXT NOT NULL,
+    trade_index   INTEGER NOT NULL,
+    result        TEXT NOT NULL DEFAULT 'unknown',
+    pnl           REAL,
+    close_reason  TEXT NOT NULL DEFAULT '',
+    source        TEXT NOT NULL DEFAULT 'bridge',
+    recorded_at   INTEGER NOT NULL,
+    UNIQUE(trade_date, trade_index)
+);
+
+CREATE TABLE IF NOT EXISTS violation_log (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_time    INTEGER NOT NULL,
+    trade_date    TEXT,
+    trade_index   INTEGER,
+    rule_code     TEXT NOT NULL,
+    severity      TEXT NOT NULL DEFAULT 'warn',
+    message       TEXT NOT NULL,
+    context_json  TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS trade_analysis (
+    trade_date             TEXT NOT NULL,
+    trade_index            INTEGER NOT NULL,
+    entry_reason           TEXT NOT NULL DEFAULT '',
+    setup_tags             TEXT NOT NULL DEFAULT '[]',
+    notes                  TEXT NOT NULL DEFAULT '',
+    mt5_screenshots        TEXT NOT NULL DEFAULT '{}',
+    tradingview_screenshots TEXT NOT NULL DEFAULT '{}',
+    created_at             TEXT NOT NULL,
+    updated_at             TEXT NOT NULL,
+    PRIMARY KEY (trade_date, trade_index)
+);
+
+-- The UNIQUE(trade_date, trade_index) constraints already index the
+-- event/ledger tables; violation_log and the daily table need explicit
+-- indexes for their newest-first queries.
+CREATE INDEX IF NOT EXISTS idx_violation_log_date_time
+    ON violation_log(trade_date, event_time DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_daily_results_date_desc
+    ON daily_results(date DESC);
+
+-- Descending composite indexes for the all-days "newest first, LIMIT N"
+-- readers: the scan walks the index in order and stops at the LIMIT
+-- instead of sorting the whole table.
+CREATE INDEX IF NOT EXISTS idx_trade_events_recent
+    ON trade_events(trade_date DESC, trade_index DESC);
+CREATE INDEX IF NOT EXISTS idx_trade_ledger_recent
+    ON trade_ledger(trade_date DESC, trade_index DESC);
+"""
+
+
+# Hot-path INSERT statements are hoisted to module constants: sqlite3 keys
+# its internal statement cache on the SQL string, so a stable object means
+# every call after the first reuses the compiled statement.
+_SQL_UPSERT_DAY = """
+    INSERT INTO daily_results (date, pnl, trades, result)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        pnl = excluded.pnl,
+        trades = excluded.trades,
+        result = excluded.result
+"""
+
+_SQL_INSERT_TRADE_EVENT = """
+    INSERT INTO trade_events (trade_date, trade_index, result, pnl, recorded_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(trade_date, trade_index) DO UPDATE SET
+        result = excluded.result,
+        pnl = COALESCE(excluded.pnl, trade_events.pnl),
+        recorded_at = excluded.recorded_at
+"""
+
+_SQL_UPSERT_TRADE_LEDGER = """
+    INSERT INTO trade_ledger (
+        trade_date, trade_index, result, pnl, close_reason, source, recorded_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(trade_date, trade_index) DO UPDATE SET
+        result = excluded.result,
+        pnl = COALESCE(excluded.pnl, trade_ledger.pnl),
+        close_reason = CASE
+            WHEN excluded.close_reason != '' THEN excluded.close_reason
+            ELSE trade_ledger.close_reason
+        END,
+        source = excluded.source,
+        recorded_at = excluded.recorded_at
+"""
+
+# Sign-indexed day classification: (pnl > 0) - (pnl < 0) maps to -1/0/+1,
+# +1 shifts it onto the tuple — no chained conditionals.
+_DAY_RESULTS = ("red", "flat", "green")
+
+
+# Second-resolution ISO timestamp cache shared by the writers: bursty
+# replay inserts land within the same second and reuse the formatted string.
+_iso_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    t = int(time.time())
+    if t != _iso_cache[0]:
+        _iso_cache[0] = t
+        _iso_cache[1] = datetime.fromtimestamp(t).isoformat(timespec="seconds")
+    return _iso_cache[1]
+
+
+def _iso_to_epoch(value) -> int:
+    """Best-effort conversion of a legacy ISO-text stamp to unix seconds."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(str(value)).timestamp())
+    except ValueError:
+        return 0
+
+
+def _dollars_to_cents(value) -> int:
+    """Convert a legacy REAL-dollars pnl to integer cents."""
+    return int(round(float(value or 0.0) * 100))
+
+
+def _epoch_to_iso(value) -> str:
+    """Render a stored unix-seconds stamp as local ISO text for display."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).isoformat(timespec="seconds")
+    return value
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """Materialize cursor rows as dicts keyed by the selected columns.
+
+    Cheaper than sqlite3.Row + dict(row): the column tuple is computed once
+    from cursor.description instead of a case-insensitive name lookup per
+    column per row.
+    """
+    cols = tuple(d[0] for d in cursor.description)
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+
+def _row_to_dict(cursor: sqlite3.Cursor) -> dict | None:
+    """Materialize a single cursor row as a dict (or None)."""
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    cols = tuple(d[0] for d in cursor.description)
+    return dict(zip(cols, row))
+
+
+_SQL_INSERT_VIOLATION = """
+    INSERT INTO violation_log (
+        event_time, trade_date, trade_index, rule_code, severity, message, context_json
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class DailyDatabase:
     """Tracks daily trading results in SQLite."""
 
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
+        # One long-lived connection instead of sqlite3.connect() per call:
+        # each open paid mutex init, WAL header mapping and a cold page
+        # cache. check_same_thread=False plus the lock below make the shared
+        # handle safe to touch from worker threads.
+        self._lock = threading.Lock()
+        # >0 while inside a bulk() block; _bulk_owner records which thread
+        # opened it so only that thread's writes join the transaction —
+        # other writers wait on the condition until the bulk commit.
+        self._bulk_depth = 0
+        self._bulk_owner: int | None = None
+        self._bulk_cond = threading.Condition(self._lock)
+        # Bumped on every committed write transaction; read caches (the
+        # overview stats below) key on it for invalidation.
+        self._write_gen = 0
+        self._stats_cache: dict[int, tuple[int, dict]] = {}
+        self._recovery_cache: tuple[int, bool] | None = None
+        self._today_cache: tuple[int, str, dict | None] | None = None
+        self._db = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=256,
+            uri=db_path.startswith("file:"),
+        )
+        self._configure(self._db)
         self._init_db()
+        # Read-only connections for the get_* paths: they can never take
+        # the write lock, so polling reads skip SQLite's locking work
+        # entirely. One connection per reader thread (thread-local) gives
+        # the "1 writer + N readers" WAL shape — the GUI thread and any DB
+        # worker thread each get their own snapshot-reading handle.
+        self._ro_local = threading.local()
+        # A mode=ro URI against :memory: would silently open a separate
+        # empty database — readers must share the RW handle instead.
+        self._ro_disabled = db_path == ":memory:" or "mode=memory" in db_path
+
+    def checkpoint(self) -> None:
+        """Fold the WAL back into the main file and truncate it.
+
+        Called at session shutdown so the next launch starts from a clean
+        checkpoint instead of replaying a day's worth of WAL frames.
+        """
+        with self._lock:
+            try:
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        """Close the shared write connection and this thread's read handle."""
+        self.checkpoint()
+        with self._lock:
+            self._db.close()
+        ro = getattr(self._ro_local, "conn", None)
+        if ro is not None:
+            ro.close()
+            self._ro_local.conn = None
 
     # ── Setup ──────────────────────────────────────────────────────────────
 
     def _init_db(self) -> None:
         with self._conn() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS daily_results (
-                    date       TEXT PRIMARY KEY,
-                    pnl        REAL NOT NULL DEFAULT 0.0,
-                    trades     INTEGER NOT NULL DEFAULT 0,
-                    result     TEXT NOT NULL DEFAULT 'flat'
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS trade_events (
-                    id           INTEGER PRIMARY KEY AUTOINCREMENT,
-                    trade_date   TEXT NOT NULL,
-                    trade_index  INTEGER NOT NULL,
-                    result       TEXT NOT NULL DEFAULT 'unknown',
-                    pnl          REAL,
-                    recorded_at  TEXT NOT NULL,
-                    UNIQUE(trade_date, trade_index)
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS trade_ledger (
-                    id            INTEGER PRIMARY KEY AUTOINCREMENT,
-                    trade_date    TEXT NOT NULL,
-                    trade_index   INTEGER NOT NULL,
-                    result        TEXT NOT NULL DEFAULT 'unknown',
-                    pnl           REAL,
-                    close_reason  TEXT NOT NULL DEFAULT '',
-                    source        TEXT NOT NULL DEFAULT 'bridge',
-                    recorded_at   TEXT NOT NULL,
-                    UNIQUE(trade_date, trade_index)
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS violation_log (
-                    id            INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_time    TEXT NOT NULL,
-                    trade_date    TEXT,
-                    trade_index   INTEGER,
-                    rule_code     TEXT NOT NULL,
-                    severity      TEXT NOT NULL DEFAULT 'warn',
-                    message       TEXT NOT NULL,
-                    context_json  TEXT NOT NULL DEFAULT '{}'
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS trade_analysis (
-                    trade_date             TEXT NOT NULL,
-                    trade_index            INTEGER NOT NULL,
-                    entry_reason           TEXT NOT NULL DEFAULT '',
-                    setup_tags             TEXT NOT NULL DEFAULT '[]',
-                    notes                  TEXT NOT NULL DEFAULT '',
-                    mt5_screenshots        TEXT NOT NULL DEFAULT '{}',
-                    tradingview_screenshots TEXT NOT NULL DEFAULT '{}',
-                    created_at             TEXT NOT NULL,
-                    updated_at             TEXT NOT NULL,
-                    PRIMARY KEY (trade_date, trade_index)
-                )
-                """
+            # Legacy databases stored ISO-text timestamps / REAL-dollar pnl;
+            # rename those tables aside so the schema script builds the new
+            # layout, then copy the rows back converted. executescript
+            # implicitly COMMITs the enclosing transaction, so a crash can
+            # leave a <table>_legacy stranded before its copy-back ran —
+            # the restore step therefore keys off the _legacy tables that
+            # actually exist (not just the ones stashed this run) and
+            # inserts idempotently, making the migration resumable.
+            self._stash_legacy_timestamp_tables(conn)
+            conn.executescript(_SCHEMA)
+            for table in self._LEGACY_MIGRATIONS:
+                if conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (f"{table}_legacy",),
+                ).fetchone():
+                    self._restore_legacy_rows(conn, table)
+            # Refresh planner statistics so the new indexes get picked.
+            conn.execute("ANALYZE")
+
+    # Legacy-schema rebuilds, keyed by table: (column, old declared type,
+    # Python converter applied during the copy). Timestamps moved from ISO
+    # TEXT to unix seconds (converted in Python — SQL strftime('%s') would
+    # reinterpret local stamps as UTC) and daily pnl from REAL dollars to
+    # integer cents.
+    _LEGACY_MIGRATIONS = {
+        "trade_events": ("recorded_at", "TEXT", staticmethod(_iso_to_epoch)),
+        "trade_ledger": ("recorded_at", "TEXT", staticmethod(_iso_to_epoch)),
+        "violation_log": ("event_time", "TEXT", staticmethod(_iso_to_epoch)),
+        "daily_results": ("pnl", "REAL", staticmethod(_dollars_to_cents)),
+    }
+
+    def _stash_legacy_timestamp_tables(self, conn: sqlite3.Connection) -> None:
+        """Rename tables still declaring a legacy column type to <name>_legacy."""
+        for table, (column, old_type, _convert) in self._LEGACY_MIGRATIONS.items():
+            info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+            declared = {row[1]: (row[2] or "").upper() for row in info}
+            if declared.get(column) == old_type:
+                conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+
+    def _restore_legacy_rows(self, conn: sqlite3.Connection, table: str) -> None:
+        """Copy rows from <table>_legacy into the new schema and drop it.
+
+        INSERT OR IGNORE keeps the copy idempotent, so re-running after an
+        interrupted earlier attempt cannot duplicate or conflict with rows
+        that already made it across.
+        """
+        column, _old_type, convert = self._LEGACY_MIGRATIONS[table]
+        convert = convert.__func__ if isinstance(convert, staticmethod) else convert
+        cursor = conn.execute(f"SELECT * FROM {table}_legacy")
+        cols = [d[0] for d in cursor.description]
+        col_index = cols.index(column)
+        placeholders = ",".join("?" for _ in cols)
+        converted = []
+        for row in cursor.fetchall():
+            row = list(row)
+            row[col_index] = convert(row[col_index])
+            converted.append(row)
+        if converted:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {table} ({','.join(cols)}) VALUES ({placeholders})",
+                converted,
             )
+        conn.execute(f"DROP TABLE {table}_legacy")
+
+    @contextmanager
+    def _conn(self):
+        """Yield the shared connection under the lock; commit on success.
 
-    def _conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        Drop-in replacement for the old open-per-call helper: the existing
+        ``with self._conn() as conn`` blocks keep their transaction
+        semantics (commit on success, rollback on error) but reuse one
+        warm connection.
+        """
+        with self._lock:
+            if self._bulk_depth and self._bulk_owner == threading.get_ident():
+                # The enclosing bulk() on this thread owns the transaction.
+                yield self._db
+                return
+            # Wait out any other thread's open bulk transaction so this
+            # write cannot silently join (and be committed or rolled back
+            # with) a transaction it knows nothing about.
+            while self._bulk_depth:
+                self._bulk_cond.wait()
+            try:
+                # Take the write lock up front: a deferred transaction that
+                # upgrades mid-statement can hit SQLITE_BUSY against a
+                # reader; IMMEDIATE plus busy_timeout removes that race.
+                self._db.execute("BEGIN IMMEDIATE")
+                yield self._db
+                self._db.commit()
+                # All writers funnel through here (readers use _read_conn),
+                # so a committed transaction is exactly "the data changed".
+                self._write_gen += 1
+            except BaseException:
+                self._db.rollback()
+                raise
+
+    @contextmanager
+    def bulk(self):
+        """Group several write calls into one transaction.
+
+        Usage::
+
+            with db.bulk():
+                db.record_day(...)
+                db.record_day(...)
+
+        One BEGIN IMMEDIATE up front and a single commit (fsync) at exit,
+        instead of one per call — the canonical SQLite bulk-insert shape.
+        Blocks nest on the owning thread: only the outermost one controls
+        the transaction, and other threads' writes wait for it to finish.
+        """
+        ident = threading.get_ident()
+        with self._lock:
+            if self._bulk_owner != ident:
+                while self._bulk_depth:
+                    self._bulk_cond.wait()
+            if self._bulk_depth == 0:
+                self._db.execute("BEGIN IMMEDIATE")
+                self._bulk_owner = ident
+            self._bulk_depth += 1
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._bulk_depth -= 1
+                if self._bulk_depth == 0:
+                    self._db.rollback()
+                    self._bulk_owner = None
+                    self._bulk_cond.notify_all()
+            raise
+        else:
+            with self._lock:
+                self._bulk_depth -= 1
+                if self._bulk_depth == 0:
+                    self._db.commit()
+                    self._write_gen += 1
+                    self._bulk_owner = None
+                    self._bulk_cond.notify_all()
+
+    @contextmanager
+    def _read_conn(self):
+        """Yield this thread's read-only connection (RW fallback).
+
+        Thread-local handles need no locking between readers and never
+        contend with the writer under WAL.
+        """
+        conn = getattr(self._ro_local, "conn", None)
+        if conn is None and not self._ro_disabled:
+            try:
+                conn = sqlite3.connect(
+                    f"file:{self.db_path.replace(chr(92), '/')}?mode=ro",
+                    uri=True,
+                    cached_statements=256,
+                )
+                conn.execute("PRAGMA query_only=ON")
+                conn.execute("PRAGMA busy_timeout=5000")
+                self._ro_local.conn = conn
+            except sqlite3.Error:
+                self._ro_disabled = True
+                conn = None
+        if conn is None:
+            # Plain lock, not _conn(): reads have nothing to commit and
+            # must not bump the write generation.
+            with self._lock:
+                yield self._db
+            return
+        yield conn
+
+    def _configure(self, conn: sqlite3.Connection) -> None:
+        """Apply performance PRAGMAs to a newly opened connection.
+
+        journal_mode=WAL persists on the database file (and lets readers run
+        concurrently with writes); the others reset per connection. WAL is
+        skipped for in-memory databases, where it does not apply.
+        """
+        if self.db_path != ":memory:" and "mode=memory" not in self.db_path:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        # Memory-map the database file: reads serve straight from the
+        # mapping instead of copying pages through the cache. 256 MB is an
+        # upper bound — pages are demand-mapped, so a small file costs
+        # nothing extra.
+        conn.execute("PRAGMA mmap_size=268435456")
+        # Checkpoint the WAL every ~200 pages instead of the default 1000:
+        # the EA streams small ledger/violation writes all session, and an
+        # unbounded -wal file slowly degrades read latency on this ~100 kB
+        # database.
+        conn.execute("PRAGMA wal_autocheckpoint=200")
 
     # ── Public API ─────────────────────────────────────────────────────────
 
@@ -102,50 +475,93 @@ class DailyDatabase:
     ) -> None:
         """Insert or replace today's result.  ``day`` defaults to today."""
         day = day or get_session_day_str()
-        result = "green" if pnl > 0 else ("red" if pnl < 0 else "flat")
+        result = _DAY_RESULTS[(pnl > 0) - (pnl < 0) + 1]
         with self._conn() as conn:
             conn.execute(
-                """
-                INSERT INTO daily_results (date, pnl, trades, result)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    pnl = excluded.pnl,
-                    trades = excluded.trades,
-                    result = excluded.result
-                """,
-                (day, pnl, trades, result),
+                _SQL_UPSERT_DAY, (day, _dollars_to_cents(pnl), trades, result)
             )
 
+    def record_many_days(self, items: list[tuple]) -> None:
+        """Upsert many daily results in one transaction (single fsync).
+
+        Items are ``(day, pnl, trades)`` tuples; the result column is
+        derived per row. Backfilling history this way costs one commit
+        instead of one per day.
+        """
+        if not items:
+            return
+        prepared = [
+            (day, _dollars_to_cents(pnl), trades, _DAY_RESULTS[(pnl > 0) - (pnl < 0) + 1])
+            for day, pnl, trades in items
+        ]
+        with self._conn() as conn:
+            conn.executemany(_SQL_UPSERT_DAY, prepared)
+
     def get_last_n_days(self, n: int = 7) -> list[dict]:
         """Return the last *n* daily results, most recent first."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT * FROM daily_results ORDER BY date DESC LIMIT ?",
-                (n,),
-            ).fetchall()
-            return [dict(r) for r in rows]
+        with self._read_conn() as conn:
+            rows = _rows_to_dicts(
+                conn.execute(
+                    "SELECT date, pnl, trades, result FROM daily_results ORDER BY date DESC LIMIT ?",
+                    (n,),
+                )
+            )
+        for row in rows:
+            row["pnl"] = row["pnl"] / 100.0
+        return rows
 
     def is_recovery_day(self) -> bool:
-        """True if the last 2 completed days were both red → forced rest day."""
-        rows = self.get_last_n_days(2)
-        if len(rows) < 2:
-            return False
-        return all(r["result"] == "red" for r in rows)
+        """True if the last 2 completed days were both red → forced rest day.
+
+        Memoized against the write generation: the guard timer asks every
+        few seconds but the answer only changes when a day is recorded or
+        cleared.
+        """
+        if self._recovery_cache is not None and self._recovery_cache[0] == self._write_gen:
+            return self._recovery_cache[1]
+        with self._read_conn() as conn:
+            row = conn.execute(
+                """
+                SELECT COUNT(*) FROM (
+                    SELECT result FROM daily_results ORDER BY date DESC LIMIT 2
+                ) WHERE result = 'red'
+                """
+            ).fetchone()
+        result = row[0] == 2
+        self._recovery_cache = (self._write_gen, result)
+        return result
 
     def get_today(self) -> dict | None:
-        """Return today's row or None."""
+        """Return today's row or None.
+
+        Memoized against the write generation and the session day: the
+        poll/guard paths ask repeatedly, but the answer only changes when
+        a day is recorded/cleared or the session day rolls over.
+        """
         today = get_session_day_str()
-        return self.get_day(today)
+        cached = self._today_cache
+        if (
+            cached is not None
+            and cached[0] == self._write_gen
+            and cached[1] == today
+        ):
+            return dict(cached[2]) if cached[2] is not None else None
+        row = self.get_day(today)
+        self._today_cache = (self._write_gen, today, row)
+        return row
 
     def get_day(self, day: str) -> dict | None:
         """Return one specific day row or None."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute(
-                "SELECT * FROM daily_results WHERE date = ?", (day,)
-            ).fetchone()
-            return dict(row) if row else None
+        with self._read_conn() as conn:
+            row = _row_to_dict(
+                conn.execute(
+                    "SELECT date, pnl, trades, result FROM daily_results WHERE date = ?",
+                    (day,),
+                )
+            )
+        if row is not None:
+            row["pnl"] = row["pnl"] / 100.0
+        return row
 
     def clear_today(self) -> None:
         """Delete today's row, if any.
@@ -155,7 +571,11 @@ class DailyDatabase:
         self.clear_day(get_session_day_str())
 
     def clear_day(self, day: str) -> None:
-        """Delete one specific day from daily and intraday tables."""
+        """Delete one specific day from daily and intraday tables.
+
+        All five DELETEs run in one transaction (single commit/fsync)
+        under _conn's BEGIN IMMEDIATE.
+        """
         with self._conn() as conn:
             conn.execute(
                 "DELETE FROM daily_results WHERE date = ?", (day,)
@@ -182,29 +602,57 @@ class DailyDatabase:
     ) -> None:
         """Insert one trade event for the given day/index (idempotent)."""
         trade_day = trade_day or get_session_day_str()
-        recorded_at = datetime.now().isoformat()
+        recorded_at = int(time.time())
         with self._conn() as conn:
             conn.execute(
-                """
-                INSERT INTO trade_events (trade_date, trade_index, result, pnl, recorded_at)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(trade_date, trade_index) DO UPDATE SET
-                    result = excluded.result,
-                    pnl = COALESCE(excluded.pnl, trade_events.pnl),
-                    recorded_at = excluded.recorded_at
-                """,
+                _SQL_INSERT_TRADE_EVENT,
                 (trade_day, trade_index, result, pnl, recorded_at),
             )
 
+    def record_trade_events_bulk(self, rows: list[tuple]) -> None:
+        """Insert many trade events in one transaction (single fsync).
+
+        Rows are ``(trade_day, trade_index, result, pnl)`` tuples. Used by
+        the bridge replay path, where per-event autocommit would pay one
+        fsync per trade.
+        """
+        if not rows:
+            return
+        recorded_at = int(time.time())
+        prepared = [(*row, recorded_at) for row in rows]
+        with self._conn() as conn:
+            conn.executemany(_SQL_INSERT_TRADE_EVENT, prepared)
+
+    def record_trade_ledger_bulk(self, rows: list[tuple]) -> None:
+        """Insert many trade ledger rows in one transaction (single fsync).
+
+        Rows are ``(trade_day, trade_index, result, pnl, close_reason,
+        source)`` tuples.
+        """
+        if not rows:
+            return
+        recorded_at = int(time.time())
+        prepared = [(*row, recorded_at) for row in rows]
+        with self._conn() as conn:
+            conn.executemany(_SQL_UPSERT_TRADE_LEDGER, prepared)
+
     def get_last_trade_index(self, trade_day: str | None = None) -> int:
         """Return max trade_index for a day (0 if none)."""
         trade_day = trade_day or get_session_day_str()
-        with self._conn() as conn:
+        with self._read_conn() as conn:
+            # ORDER BY … LIMIT 1 seeks the last key of the composite index
+            # directly; MAX() with a WHERE filter does not always get that
+            # shortcut from the planner.
             row = conn.execute(
-                "SELECT MAX(trade_index) FROM trade_events WHERE trade_date = ?",
+                """
+                SELECT trade_index FROM trade_events
+                WHERE trade_date = ?
+                ORDER BY trade_index DESC
+                LIMIT 1
+                """,
                 (trade_day,),
             ).fetchone()
-            return int(row[0] or 0)
+            return int(row[0]) if row else 0
 
     def get_trade_events(
         self,
@@ -212,10 +660,9 @@ class DailyDatabase:
         limit: int = 100,
     ) -> list[dict]:
         """Return trade events newest first; optionally restricted to one day."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             if trade_day:
-                rows = conn.execute(
+                cursor = conn.execute(
                     """
                     SELECT trade_date, trade_index, result, pnl, recorded_at
                     FROM trade_events
@@ -224,9 +671,9 @@ class DailyDatabase:
                     LIMIT ?
                     """,
                     (trade_day, limit),
-                ).fetchall()
+                )
             else:
-                rows = conn.execute(
+                cursor = conn.execute(
                     """
                     SELECT trade_date, trade_index, result, pnl, recorded_at
                     FROM trade_events
@@ -234,8 +681,11 @@ class DailyDatabase:
                     LIMIT ?
                     """,
                     (limit,),
-                ).fetchall()
-            return [dict(r) for r in rows]
+                )
+            rows = _rows_to_dicts(cursor)
+        for row in rows:
+            row["recorded_at"] = _epoch_to_iso(row["recorded_at"])
+        return rows
 
     def prune_ambiguous_bridge_trades(self, trade_day: str | None = None) -> int:
         """Delete placeholder bridge rows that look like ghost trades.
@@ -246,7 +696,6 @@ class DailyDatabase:
         """
         trade_day = trade_day or get_session_day_str()
         with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
             rows = conn.execute(
                 """
                 SELECT trade_index
@@ -260,7 +709,7 @@ class DailyDatabase:
                 """,
                 (trade_day,),
             ).fetchall()
-            indexes = [int(r["trade_index"]) for r in rows]
+            indexes = [int(r[0]) for r in rows]
             if not indexes:
                 return 0
 
@@ -299,24 +748,10 @@ class DailyDatabase:
     ) -> None:
         """Insert one trade ledger row for the given day/index (idempotent)."""
         trade_day = trade_day or get_session_day_str()
-        recorded_at = datetime.now().isoformat()
+        recorded_at = int(time.time())
         with self._conn() as conn:
             conn.execute(
-                """
-                INSERT INTO trade_ledger (
-                    trade_date, trade_index, result, pnl, close_reason, source, recorded_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(trade_date, trade_index) DO UPDATE SET
-                    result = excluded.result,
-                    pnl = COALESCE(excluded.pnl, trade_ledger.pnl),
-                    close_reason = CASE
-                        WHEN excluded.close_reason != '' THEN excluded.close_reason
-                        ELSE trade_ledger.close_reason
-                    END,
-                    source = excluded.source,
-                    recorded_at = excluded.recorded_at
-                """,
+                _SQL_UPSERT_TRADE_LEDGER,
                 (trade_day, trade_index, result, pnl, close_reason, source, recorded_at),
             )
 
@@ -326,10 +761,9 @@ class DailyDatabase:
         limit: int = 200,
     ) -> list[dict]:
         """Return trade ledger rows newest first; optionally restricted to one day."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             if trade_day:
-                rows = conn.execute(
+                cursor = conn.execute(
                     """
                     SELECT trade_date, trade_index, result, pnl, close_reason, source, recorded_at
                     FROM trade_ledger
@@ -338,9 +772,9 @@ class DailyDatabase:
                     LIMIT ?
                     """,
                     (trade_day, limit),
-                ).fetchall()
+                )
             else:
-                rows = conn.execute(
+                cursor = conn.execute(
                     """
                     SELECT trade_date, trade_index, result, pnl, close_reason, source, recorded_at
                     FROM trade_ledger
@@ -348,8 +782,11 @@ class DailyDatabase:
                     LIMIT ?
                     """,
                     (limit,),
-                ).fetchall()
-            return [dict(r) for r in rows]
+                )
+            rows = _rows_to_dicts(cursor)
+        for row in rows:
+            row["recorded_at"] = _epoch_to_iso(row["recorded_at"])
+        return rows
 
     def record_violation(
         self,
@@ -363,16 +800,13 @@ class DailyDatabase:
     ) -> None:
         """Append a rule violation / enforcement event to the audit log."""
         trade_day = trade_day or get_session_day_str()
-        event_time = event_time or datetime.now().isoformat()
-        context_json = json.dumps(context or {}, ensure_ascii=True)
+        # Accept legacy ISO strings from callers; store unix seconds.
+        event_time = _iso_to_epoch(event_time) if event_time else int(time.time())
+        # Automated logs mostly carry no context — skip the encoder then.
+        context_json = _dumps_text(context) if context else "{}"
         with self._conn() as conn:
             conn.execute(
-                """
-                INSERT INTO violation_log (
-                    event_time, trade_date, trade_index, rule_code, severity, message, context_json
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_VIOLATION,
                 (event_time, trade_day, trade_index, rule_code, severity, message, context_json),
             )
 
@@ -382,10 +816,9 @@ class DailyDatabase:
         limit: int = 200,
     ) -> list[dict]:
         """Return violation log rows newest first; optionally restricted to one day."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
+        with self._read_conn() as conn:
             if trade_day:
-                rows = conn.execute(
+                cursor = conn.execute(
                     """
                     SELECT event_time, trade_date, trade_index, rule_code, severity, message, context_json
                     FROM violation_log
@@ -394,9 +827,9 @@ class DailyDatabase:
                     LIMIT ?
                     """,
                     (trade_day, limit),
-                ).fetchall()
+                )
             else:
-                rows = conn.execute(
+                cursor = conn.execute(
                     """
                     SELECT event_time, trade_date, trade_index, rule_code, severity, message, context_json
                     FROM violation_log
@@ -404,8 +837,11 @@ class DailyDatabase:
                     LIMIT ?
                     """,
                     (limit,),
-                ).fetchall()
-            return [dict(r) for r in rows]
+                )
+            rows = _rows_to_dicts(cursor)
+        for row in rows:
+            row["event_time"] = _epoch_to_iso(row["event_time"])
+        return rows
 
     def upsert_trade_analysis(
         self,
@@ -418,10 +854,10 @@ class DailyDatabase:
         tradingview_screenshots: dict | None = None,
     ) -> None:
         """Insert or update analysis metadata for one trade."""
-        now = datetime.now().isoformat()
-        setup_tags_json = json.dumps(setup_tags or [], ensure_ascii=True)
-        mt5_json = json.dumps(mt5_screenshots or {}, ensure_ascii=True)
-        tv_json = json.dumps(tradingview_screenshots or {}, ensure_ascii=True)
+        now = _now_iso()
+        setup_tags_json = _dumps_text(setup_tags) if setup_tags else "[]"
+        mt5_json = _dumps_text(mt5_screenshots) if mt5_screenshots else "{}"
+        tv_json = _dumps_text(tradingview_screenshots) if tradingview_screenshots else "{}"
         with self._conn() as conn:
             conn.execute(
                 """
@@ -453,71 +889,74 @@ class DailyDatabase:
 
     def get_trade_analysis(self, trade_date: str, trade_index: int) -> dict | None:
         """Return analysis metadata for one trade, if available."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute(
-                """
-                SELECT trade_date, trade_index, entry_reason, setup_tags, notes,
-                       mt5_screenshots, tradingview_screenshots, created_at, updated_at
-                FROM trade_analysis
-                WHERE trade_date = ? AND trade_index = ?
-                """,
-                (trade_date, trade_index),
-            ).fetchone()
-            if not row:
+        with self._read_conn() as conn:
+            data = _row_to_dict(
+                conn.execute(
+                    """
+                    SELECT trade_date, trade_index, entry_reason, setup_tags, notes,
+                           mt5_screenshots, tradingview_screenshots, created_at, updated_at
+                    FROM trade_analysis
+                    WHERE trade_date = ? AND trade_index = ?
+                    """,
+                    (trade_date, trade_index),
+                )
+            )
+            if not data:
                 return None
-
-            data = dict(row)
-            try:
-                data["setup_tags"] = json.loads(data.get("setup_tags") or "[]")
-            except Exception:
-                data["setup_tags"] = []
-            try:
-                data["mt5_screenshots"] = json.loads(data.get("mt5_screenshots") or "{}")
-            except Exception:
-                data["mt5_screenshots"] = {}
-            try:
-                data["tradingview_screenshots"] = json.loads(data.get("tradingview_screenshots") or "{}")
-            except Exception:
-                data["tradingview_screenshots"] = {}
+            # These blobs are only ever written by upsert_trade_analysis,
+            # so they are known-valid JSON — no per-field try/except needed.
+            data["setup_tags"] = _loads(data.get("setup_tags") or "[]")
+            data["mt5_screenshots"] = _loads(data.get("mt5_screenshots") or "{}")
+            data["tradingview_screenshots"] = _loads(data.get("tradingview_screenshots") or "{}")
             return data
 
     def get_overview_stats(self, days: int = 30) -> dict:
-        """Aggregate history stats over the last *days* days."""
-        with self._conn() as conn:
-            conn.row_factory = sqlite3.Row
-            daily_rows = conn.execute(
+        """Aggregate history stats over the last *days* days.
+
+        Memoized per *days* until the next committed write; polling UIs
+        re-request this many times per minute with nothing changed.
+        """
+        cached = self._stats_cache.get(days)
+        if cached is not None and cached[0] == self._write_gen:
+            return cached[1]
+        with self._read_conn() as conn:
+            daily = conn.execute(
                 """
-                SELECT date, pnl, trades, result
-                FROM daily_results
-                ORDER BY date DESC
-                LIMIT ?
+                SELECT COUNT(*),
+                       COALESCE(SUM(pnl), 0),
+                       COALESCE(SUM(trades), 0),
+                       COALESCE(SUM(CASE WHEN result = 'green' THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(CASE WHEN result = 'red' THEN 1 ELSE 0 END), 0)
+                FROM (
+                    SELECT pnl, trades, result
+                    FROM daily_results
+                    ORDER BY date DESC
+                    LIMIT ?
+                )
                 """,
                 (days,),
-            ).fetchall()
-            trade_rows = conn.execute(
+            ).fetchone()
+            trades = conn.execute(
                 """
-                SELECT result
+                SELECT COUNT(*),
+                       COALESCE(SUM(CASE WHEN lower(result) = 'win' THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(CASE WHEN lower(result) = 'loss' THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(CASE WHEN lower(result) IN ('be', 'flat', 'breakeven')
+                                     THEN 1 ELSE 0 END), 0)
                 FROM trade_events
                 WHERE trade_date >= date('now', ?)
                 """,
                 (f"-{max(days - 1, 0)} day",),
-            ).fetchall()
+            ).fetchone()
 
-        wins = sum(1 for r in trade_rows if (r["result"] or "").lower() == "win")
-        losses = sum(1 for r in trade_rows if (r["result"] or "").lower() == "loss")
-        breakeven = sum(1 for r in trade_rows if (r["result"] or "").lower() in ("be", "flat", "breakeven"))
-        unknown = sum(1 for r in trade_rows if (r["result"] or "").lower() not in ("win", "loss", "be", "flat", "breakeven"))
+        total_days, total_pnl_cents, total_trades, green_days, red_days = daily
+        total_pnl = total_pnl_cents / 100.0
+        total_events, wins, losses, breakeven = trades
+        unknown = total_events - wins - losses - breakeven
         decided = wins + losses
         win_rate = (wins / decided * 100.0) if decided else 0.0
 
-        total_pnl = sum(float(r["pnl"]) for r in daily_rows) if daily_rows else 0.0
-        total_days = len(daily_rows)
-        green_days = sum(1 for r in daily_rows if (r["result"] or "") == "green")
-        red_days = sum(1 for r in daily_rows if (r["result"] or "") == "red")
-        total_trades = sum(int(r["trades"]) for r in daily_rows) if daily_rows else 0
-
-        return {
+        stats = {
             "days": days,
             "total_days": total_days,
             "green_days": green_days,
@@ -530,3 +969,5 @@ class DailyDatabase:
             "unknown": unknown,
             "win_rate": win_rate,
         }
+        self._stats_cache[days] = (self._write_gen, stats)
+        return stats
@@ -7,6 +7,7 @@ import sys
 import os
 import logging
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont
 
@@ -23,21 +24,26 @@ logging.basicConfig(
 )
 
 
+_QSS_PATH = os.path.join(os.path.dirname(__file__), "ui", "styles.qss")
+_qss_cache = {"mtime": 0, "text": ""}
+
+
 def load_stylesheet() -> str:
-    """Read the QSS file from the ui/ directory."""
-    qss_path = os.path.join(
-        os.path.dirname(__file__), "ui", "styles.qss"
-    )
-    with open(qss_path, "r", encoding="utf-8") as f:
-        return f.read()
+    """Read the QSS file from the ui/ directory (cached by mtime)."""
+    try:
+        st = os.stat(_QSS_PATH)
+    except OSError:
+        return _qss_cache["text"]
+    if st.st_mtime_ns != _qss_cache["mtime"]:
+        with open(_QSS_PATH, "r", encoding="utf-8") as f:
+            _qss_cache["text"] = f.read()
+        _qss_cache["mtime"] = st.st_mtime_ns
+    return _qss_cache["text"]
 
 
 def main():
     app = QApplication(sys.argv)
 
-    # Apply dark stylesheet
-    app.setStyleSheet(load_stylesheet())
-
     # Set a decent default font
     font = QFont("Segoe UI")
     font.setPixelSize(14)
@@ -46,6 +52,10 @@ def main():
     window = MainWindow()
     window.show()
 
+    # Apply the dark stylesheet right after the first paint: reading the
+    # QSS synchronously before show() delayed time-to-first-frame.
+    QTimer.singleShot(0, lambda: app.setStyleSheet(load_stylesheet()))
+
     sys.exit(app.exec())
 
 
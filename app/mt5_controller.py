@@ -3,8 +3,10 @@ TradingGuard — MT5 Process Controller
 Launch, kill, and monitor the MetaTrader 5 terminal process on Windows.
 """
 
+import ctypes
 import subprocess
 import logging
+import time
 
 from app.config import MT5_EXE_PATH
 
@@ -12,25 +14,132 @@ log = logging.getLogger(__name__)
 
 _MT5_PROCESS_NAME = "terminal64.exe"
 
+# tasklist forks a child process (~100ms); the UI guard polls this several
+# times per tick, so cache the answer briefly. launch/kill bypass and
+# invalidate the cache since they change the answer.
+_RUNNING_TTL_S = 2.0
+_last_check = 0.0
+_last_result = False
 
-def is_mt5_running() -> bool:
-    """Return True if terminal64.exe is in the Windows task list."""
+
+# Lazily-built Toolhelp32 machinery: (kernel32, PROCESSENTRY32W). Built once
+# on first use; set to False after a failure so we stop retrying ctypes on
+# every call (e.g. when running under a non-Windows interpreter).
+_toolhelp = None
+
+
+def _get_toolhelp():
+    global _toolhelp
+    if _toolhelp is not None:
+        return _toolhelp or None
     try:
-        result = subprocess.run(
-            ["tasklist", "/FI", f"IMAGENAME eq {_MT5_PROCESS_NAME}"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        return _MT5_PROCESS_NAME.lower() in result.stdout.lower()
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_size_t),
+                ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", wintypes.LONG),
+                ("dwFlags", wintypes.DWORD),
+                ("szExeFile", wintypes.WCHAR * 260),
+            ]
+
+        # Without explicit signatures ctypes assumes C int, which truncates
+        # 64-bit HANDLEs and corrupts the snapshot handle.
+        entry_p = ctypes.POINTER(PROCESSENTRY32W)
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+        kernel32.Process32FirstW.restype = wintypes.BOOL
+        kernel32.Process32FirstW.argtypes = (wintypes.HANDLE, entry_p)
+        kernel32.Process32NextW.restype = wintypes.BOOL
+        kernel32.Process32NextW.argtypes = (wintypes.HANDLE, entry_p)
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+        _toolhelp = (kernel32, PROCESSENTRY32W)
+        return _toolhelp
     except Exception as exc:
-        log.warning("tasklist check failed: %s", exc)
-        return False
+        log.debug("WinAPI process snapshot unavailable: %s", exc)
+        _toolhelp = False
+        return None
+
+
+def _is_running_via_winapi() -> bool | None:
+    """Check for terminal64.exe via a Toolhelp32 process snapshot.
+
+    Walking the in-process list takes <1ms versus ~100ms to fork
+    tasklist.exe. Returns None when the WinAPI path is unavailable so the
+    caller can fall back to tasklist.
+    """
+    toolhelp = _get_toolhelp()
+    if toolhelp is None:
+        return None
+    kernel32, PROCESSENTRY32W = toolhelp
+    try:
+        TH32CS_SNAPPROCESS = 0x2
+        INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+            return None
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            found = False
+            has_entry = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while has_entry:
+                if entry.szExeFile.lower() == _MT5_PROCESS_NAME:
+                    found = True
+                    break
+                has_entry = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+            return found
+        finally:
+            kernel32.CloseHandle(snapshot)
+    except Exception as exc:
+        log.debug("WinAPI process snapshot failed: %s", exc)
+        return None
+
+
+def is_mt5_running(force: bool = False) -> bool:
+    """Return True if terminal64.exe is in the Windows task list.
+
+    The result is cached for a short TTL; pass ``force=True`` to re-query
+    immediately.
+    """
+    global _last_check, _last_result
+    if not force and time.monotonic() - _last_check < _RUNNING_TTL_S:
+        return _last_result
+    running = _is_running_via_winapi()
+    if running is None:
+        try:
+            result = subprocess.run(
+                ["tasklist", "/FI", f"IMAGENAME eq {_MT5_PROCESS_NAME}"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            running = _MT5_PROCESS_NAME.lower() in result.stdout.lower()
+        except Exception as exc:
+            log.warning("tasklist check failed: %s", exc)
+            running = False
+    _last_result = running
+    _last_check = time.monotonic()
+    return _last_result
+
+
+def _invalidate_running_cache() -> None:
+    global _last_check
+    _last_check = 0.0
 
 
 def launch_mt5(exe_path: str = MT5_EXE_PATH) -> bool:
     """Start MT5 if it is not already running.  Returns True on success."""
-    if is_mt5_running():
+    if is_mt5_running(force=True):
         log.info("MT5 is already running.")
         return True
     try:
@@ -38,6 +147,7 @@ def launch_mt5(exe_path: str = MT5_EXE_PATH) -> bool:
             [exe_path],
             creationflags=subprocess.DETACHED_PROCESS,
         )
+        _invalidate_running_cache()
         log.info("MT5 launched: %s", exe_path)
         return True
     except FileNotFoundError:
@@ -50,7 +160,7 @@ def launch_mt5(exe_path: str = MT5_EXE_PATH) -> bool:
 
 def kill_mt5() -> bool:
     """Force-kill the MT5 terminal.  Returns True on success."""
-    if not is_mt5_running():
+    if not is_mt5_running(force=True):
         log.info("MT5 is not running; nothing to kill.")
         return True
     try:
@@ -60,6 +170,7 @@ def kill_mt5() -> bool:
             text=True,
             timeout=10,
         )
+        _invalidate_running_cache()
         ok = result.returncode == 0
         if ok:
             log.info("MT5 terminated.")
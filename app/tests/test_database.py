@@ -1,16 +1,23 @@
 """Tests for the DailyDatabase (SQLite daily results tracker)."""
 
-import os
-import tempfile
+import sqlite3
+import uuid
+
 import pytest
 from app.database import DailyDatabase
 
 
 @pytest.fixture
-def db(tmp_path):
-    """Create a database with a temp file."""
-    path = str(tmp_path / "test.db")
-    return DailyDatabase(db_path=path)
+def db():
+    """Create a private in-memory database (no filesystem I/O).
+
+    A uniquely named shared-cache memory URI keeps tests isolated from
+    each other (and from parallel pytest-xdist workers) while skipping
+    file creation, WAL setup and fsync entirely.
+    """
+    return DailyDatabase(
+        db_path=f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    )
 
 
 class TestDailyDatabase:
@@ -34,8 +41,9 @@ class TestDailyDatabase:
         assert rows[0]["result"] == "flat"
 
     def test_upsert_updates_existing(self, db):
-        db.record_day(pnl=5.0, trades=1, day="2026-02-18")
-        db.record_day(pnl=-3.0, trades=2, day="2026-02-18")
+        with db.bulk():
+            db.record_day(pnl=5.0, trades=1, day="2026-02-18")
+            db.record_day(pnl=-3.0, trades=2, day="2026-02-18")
         rows = db.get_last_n_days(5)
         assert len(rows) == 1
         assert rows[0]["pnl"] == -3.0
@@ -49,8 +57,9 @@ class TestDailyDatabase:
         assert db.is_recovery_day() is False
 
     def test_is_recovery_day_true_with_two_reds(self, db):
-        db.record_day(pnl=-5.0, trades=2, day="2026-02-17")
-        db.record_day(pnl=-8.0, trades=3, day="2026-02-18")
+        with db.bulk():
+            db.record_day(pnl=-5.0, trades=2, day="2026-02-17")
+            db.record_day(pnl=-8.0, trades=3, day="2026-02-18")
         assert db.is_recovery_day() is True
 
     def test_is_recovery_day_false_with_green_then_red(self, db):
@@ -59,9 +68,10 @@ class TestDailyDatabase:
         assert db.is_recovery_day() is False
 
     def test_get_last_n_days_ordering(self, db):
-        db.record_day(pnl=1.0, trades=1, day="2026-02-15")
-        db.record_day(pnl=2.0, trades=1, day="2026-02-16")
-        db.record_day(pnl=3.0, trades=1, day="2026-02-17")
+        with db.bulk():
+            db.record_day(pnl=1.0, trades=1, day="2026-02-15")
+            db.record_day(pnl=2.0, trades=1, day="2026-02-16")
+            db.record_day(pnl=3.0, trades=1, day="2026-02-17")
         rows = db.get_last_n_days(2)
         assert len(rows) == 2
         assert rows[0]["date"] == "2026-02-17"  # most recent first
@@ -183,3 +193,168 @@ class TestDailyDatabase:
         assert row["notes"] == "Second review."
         assert row["mt5_screenshots"]["M15"].endswith("mt5_m15_v2.png")
         assert row["tradingview_screenshots"]["H1"].endswith("tv_h1_v2.png")
+
+    def test_bulk_trade_event_and_ledger_insert(self, db):
+        db.record_trade_events_bulk(
+            [
+                ("2026-02-21", 1, "win", 4.0),
+                ("2026-02-21", 2, "loss", -6.0),
+            ]
+        )
+        db.record_trade_ledger_bulk(
+            [
+                ("2026-02-21", 1, "win", 4.0, "session_update", "bridge"),
+                ("2026-02-21", 2, "loss", -6.0, "session_update", "bridge"),
+            ]
+        )
+
+        events = db.get_trade_events(trade_day="2026-02-21", limit=10)
+        ledger = db.get_trade_ledger(trade_day="2026-02-21", limit=10)
+        assert len(events) == 2
+        assert len(ledger) == 2
+        assert events[0]["trade_index"] == 2
+        assert ledger[0]["result"] == "loss"
+        assert db.get_last_trade_index("2026-02-21") == 2
+
+    def test_record_many_days_bulk_upsert(self, db):
+        db.record_many_days(
+            [
+                ("2026-03-01", 5.0, 1),
+                ("2026-03-02", -2.0, 2),
+                ("2026-03-03", 0.0, 1),
+            ]
+        )
+        rows = db.get_last_n_days(3)
+        assert [r["result"] for r in rows] == ["flat", "red", "green"]
+        # Upsert semantics on re-record
+        db.record_many_days([("2026-03-02", 4.0, 3)])
+        assert db.get_day("2026-03-02")["result"] == "green"
+
+
+class TestLegacySchemaMigration:
+    """File-based coverage for the startup schema rebuild.
+
+    The migration destructively rewrites production tables (rename,
+    converted copy-back, drop), so it gets exercised against real files
+    here — the shared fixture's in-memory databases never hit this path.
+    """
+
+    def _create_legacy_db(self, path):
+        """Build a database with the pre-migration schema and sample rows."""
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE daily_results (
+                date       TEXT PRIMARY KEY,
+                pnl        REAL NOT NULL DEFAULT 0.0,
+                trades     INTEGER NOT NULL DEFAULT 0,
+                result     TEXT NOT NULL DEFAULT 'flat'
+            );
+            INSERT INTO daily_results VALUES ('2026-02-18', 15.55, 2, 'green');
+
+            CREATE TABLE trade_events (
+                id           INTEGER PRIMARY KEY AUTOINCREMENT,
+                trade_date   TEXT NOT NULL,
+                trade_index  INTEGER NOT NULL,
+                result       TEXT NOT NULL DEFAULT 'unknown',
+                pnl          REAL,
+                recorded_at  TEXT NOT NULL,
+                UNIQUE(trade_date, trade_index)
+            );
+            INSERT INTO trade_events (trade_date, trade_index, result, pnl, recorded_at)
+                VALUES ('2026-02-18', 1, 'win', 4.5, '2026-02-18T12:30:45');
+
+            CREATE TABLE violation_log (
+                id            INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_time    TEXT NOT NULL,
+                trade_date    TEXT,
+                trade_index   INTEGER,
+                rule_code     TEXT NOT NULL,
+                severity      TEXT NOT NULL DEFAULT 'warn',
+                message       TEXT NOT NULL,
+                context_json  TEXT NOT NULL DEFAULT '{}'
+            );
+            INSERT INTO violation_log (event_time, trade_date, rule_code, message)
+                VALUES ('2026-02-18T13:00:00', '2026-02-18', 'TEST_RULE', 'legacy row');
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    def test_migrates_text_timestamps_and_real_pnl(self, tmp_path):
+        path = str(tmp_path / "legacy.db")
+        self._create_legacy_db(path)
+
+        db = DailyDatabase(db_path=path)
+        assert db.get_day("2026-02-18")["pnl"] == 15.55
+        events = db.get_trade_events(trade_day="2026-02-18")
+        assert events[0]["recorded_at"] == "2026-02-18T12:30:45"
+        violations = db.get_violation_log(trade_day="2026-02-18")
+        assert violations[0]["event_time"] == "2026-02-18T13:00:00"
+
+        # On disk the columns hold the new types and no _legacy remains.
+        raw = sqlite3.connect(path)
+        assert raw.execute(
+            "SELECT pnl, typeof(pnl) FROM daily_results"
+        ).fetchone() == (1555, "integer")
+        assert raw.execute(
+            "SELECT typeof(recorded_at) FROM trade_events"
+        ).fetchone() == ("integer",)
+        tables = {
+            r[0]
+            for r in raw.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        assert not any(name.endswith("_legacy") for name in tables)
+        raw.close()
+
+    def test_reopen_after_migration_is_idempotent(self, tmp_path):
+        path = str(tmp_path / "legacy.db")
+        self._create_legacy_db(path)
+
+        DailyDatabase(db_path=path)
+        db = DailyDatabase(db_path=path)
+        assert db.get_day("2026-02-18")["pnl"] == 15.55
+        assert len(db.get_trade_events(trade_day="2026-02-18")) == 1
+
+    def test_resumes_stranded_legacy_tables(self, tmp_path):
+        """A crash between the stash commit and the copy-back must recover."""
+        path = str(tmp_path / "stranded.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE daily_results_legacy (
+                date       TEXT PRIMARY KEY,
+                pnl        REAL NOT NULL DEFAULT 0.0,
+                trades     INTEGER NOT NULL DEFAULT 0,
+                result     TEXT NOT NULL DEFAULT 'flat'
+            );
+            INSERT INTO daily_results_legacy VALUES ('2026-02-18', 10.0, 1, 'green');
+            INSERT INTO daily_results_legacy VALUES ('2026-02-19', -5.0, 2, 'red');
+
+            -- New-schema table already created, one row already copied
+            -- (simulates a crash partway through the copy-back).
+            CREATE TABLE daily_results (
+                date       TEXT PRIMARY KEY,
+                pnl        INTEGER NOT NULL DEFAULT 0,
+                trades     INTEGER NOT NULL DEFAULT 0,
+                result     TEXT NOT NULL DEFAULT 'flat'
+            );
+            INSERT INTO daily_results VALUES ('2026-02-18', 1000, 1, 'green');
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        db = DailyDatabase(db_path=path)
+        rows = db.get_last_n_days(5)
+        assert [(r["date"], r["pnl"]) for r in rows] == [
+            ("2026-02-19", -5.0),
+            ("2026-02-18", 10.0),
+        ]
+        raw = sqlite3.connect(path)
+        tables = {
+            r[0]
+            for r in raw.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        assert "daily_results_legacy" not in tables
+        raw.close()
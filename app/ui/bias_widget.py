@@ -11,7 +11,7 @@ Phase 3 additions:
 
 from datetime import datetime
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QComboBox,
     QDoubleSpinBox, QGroupBox, QFormLayout, QCheckBox,
@@ -25,6 +25,12 @@ class BiasWidget(QWidget):
     def __init__(self, bridge, parent=None):
         super().__init__(parent)
         self._bridge = bridge
+        # Debounce form edits: scrolling the price spinbox fires
+        # valueChanged per step, and each write is a disk round-trip.
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(200)
+        self._debounce.timeout.connect(self._flush)
         self._build_ui()
 
     def _build_ui(self):
@@ -67,6 +73,10 @@ class BiasWidget(QWidget):
     # ── Sync to bridge ────────────────────────────────────────────────────
 
     def _on_change(self):
+        """Queue a bridge write; rapid edits collapse into one flush."""
+        self._debounce.start()
+
+    def _flush(self):
         """Persist bias-related fields to session.json.
 
         - bias / invalidation_price reflect the current form.
@@ -77,7 +87,7 @@ class BiasWidget(QWidget):
         - trading_allowed is set True so that after bias expiry, a new analysis
           re-enables trading (EA still honours full shutdown flags).
         """
-        now = datetime.now().isoformat()
+        now = datetime.now().isoformat(timespec="seconds")
         self._bridge.update(
             bias=self._combo.currentText().lower(),
             invalidation_price=self._price_spin.value(),
@@ -0,0 +1,57 @@
+"""
+TradingGuard — Daily History Table Model
+Read-only QAbstractTableModel over the daily_results rows so the History
+tab can use a QTableView: one model reset per refresh instead of 4×N
+QTableWidgetItem allocations through the C++ bridge.
+"""
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+_HEADERS = ("Date", "P&L ($)", "Trades", "Result")
+
+# Precomputed formatters: a bound format method and a fixed-vocabulary
+# lookup beat per-row f-string parsing and str.upper().
+_FMT_PNL = "${:+.2f}".format
+_RESULT_UPPER = {"green": "GREEN", "red": "RED", "flat": "FLAT"}
+
+
+class DailyHistoryModel(QAbstractTableModel):
+    """Model over pre-formatted (date, pnl, trades, result) display rows."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple[str, str, str, str]] = []
+
+    def set_rows(self, rows: list[dict]) -> None:
+        """Replace the contents from DailyDatabase.get_last_n_days rows."""
+        formatted = [
+            (
+                row["date"],
+                _FMT_PNL(row["pnl"]),
+                str(row["trades"]),
+                _RESULT_UPPER.get(row["result"], (row["result"] or "").upper()),
+            )
+            for row in rows
+        ]
+        self.beginResetModel()
+        self._rows = formatted
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return _HEADERS[section]
+        return None
@@ -1,28 +1,38 @@
 """
 TradingGuard — Main Window
 Central QMainWindow with three tabs: Analysis, Session, History.
-Polls session.json on a timer and orchestrates session lifecycle.
+Reacts to session.json changes (file watcher + fallback timer) and
+orchestrates session lifecycle.
 """
 
 import os
 import logging
+import time
 from datetime import datetime, timedelta
 
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import (
+    QFileSystemWatcher, QObject, QThread, QTimer, Qt, pyqtSignal, pyqtSlot,
+)
 from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QPushButton, QTableWidget, QTableWidgetItem,
-    QMessageBox, QStatusBar, QFrame,
+    QLabel, QPushButton, QScrollArea, QTableView, QTableWidget,
+    QTableWidgetItem, QMessageBox, QStatusBar, QFrame,
 )
 
-from app.bridge import SessionBridge
+from app.bridge import SessionBridge, SessionState
 from app.database import DailyDatabase
 from app import mt5_controller
 from app.config import (
-    SESSION_POLL_INTERVAL_MS,
+    SESSION_FALLBACK_POLL_INTERVAL_MS,
     EA_HEARTBEAT_TIMEOUT_SECONDS,
+    TRADING_START_HOUR,
+    TRADING_END_HOUR,
     get_session_day_str,
+    get_tehran_time_str,
+    is_daily_break_time,
+    is_within_trading_hours,
 )
+from app.ui.history_model import DailyHistoryModel
 from app.ui.timer_widget import TimerWidget
 from app.ui.bias_widget import BiasWidget
 from app.ui.news_lock_widget import NewsLockWidget
@@ -31,10 +41,50 @@ from app.ui.trade_analysis_widget import TradeAnalysisWidget
 
 log = logging.getLogger(__name__)
 
+# Precomputed row formatters for the history loops (the daily table's live
+# in history_model): bound format methods and fixed-vocabulary lookups
+# avoid re-parsing an f-string and calling str.upper() per row.
+_FMT_PNL = "${:+.2f}".format
+_TRADE_RESULT_UPPER = {
+    "win": "WIN", "loss": "LOSS", "flat": "FLAT", "be": "BE",
+    "breakeven": "BREAKEVEN", "unknown": "UNKNOWN",
+}
+_SEVERITY_UPPER = {"info": "INFO", "warn": "WARN", "critical": "CRITICAL"}
+
+# MT5 guard cadence: fast while a block is being enforced, relaxed while
+# idle (nothing to enforce means MT5 is allowed anyway).
+_GUARD_INTERVAL_ACTIVE_MS = 5000
+_GUARD_INTERVAL_IDLE_MS = 30_000
+
+
+class _HistoryWorker(QObject):
+    """Runs the History-tab queries on a worker thread.
+
+    Reads go through DailyDatabase's thread-local read-only connection, so
+    they neither block the GUI thread nor contend with its writes.
+    """
+
+    loaded = pyqtSignal(dict, list, list, list)
+
+    def __init__(self, db: DailyDatabase):
+        super().__init__()
+        self._db = db
+
+    @pyqtSlot()
+    def load(self):
+        self.loaded.emit(
+            self._db.get_overview_stats(days=30),
+            self._db.get_last_n_days(30),
+            self._db.get_trade_ledger(limit=150),
+            self._db.get_violation_log(limit=150),
+        )
+
 
 class MainWindow(QMainWindow):
     """Top-level application window."""
 
+    _history_refresh_requested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TradingGuard")
@@ -42,9 +92,27 @@ class MainWindow(QMainWindow):
 
         self._bridge = SessionBridge()
         self._db = DailyDatabase()
+
+        # History queries run on a worker thread via a queued signal
+        # round-trip, keeping disk reads off the paint/input path.
+        self._db_thread = QThread(self)
+        self._history_worker = _HistoryWorker(self._db)
+        self._history_worker.moveToThread(self._db_thread)
+        self._history_refresh_requested.connect(self._history_worker.load)
+        self._history_worker.loaded.connect(self._populate_history)
+        self._db_thread.start()
         self._session_started = False
         self._shutdown_done = False
         self._break_until = None  # 1-hour break after consecutive losses
+        # (raw string, parsed datetime) of the last break_until seen, so the
+        # 5s guard tick doesn't re-run fromisoformat on an unchanged value.
+        self._break_until_cache: tuple[str, datetime | None] = ("", None)
+        self._mt5_last_killed = 0.0  # monotonic stamp for kill rate-limiting
+        # Guard short-circuit state: (bridge file key, minute-of-day,
+        # shutdown flag) of the last tick plus whether it concluded idle.
+        self._last_guard_state: tuple | None = None
+        self._guard_idle = False
+        self._closing = False
         self._prev_trades_today = None
         self._prev_net_pnl = None
         self._prev_shutdown_signal = False
@@ -53,6 +121,8 @@ class MainWindow(QMainWindow):
         self._prev_news_lock = False
         self._violation_dedupe: set[str] = set()
         self._session_day_key = get_session_day_str()
+        self._last_poll_data: dict | None = None
+        self._last_session_key: tuple[int, int] | None = None
         self._active_session_since: datetime | None = None
         self._last_seen_ea_heartbeat: str = ""
         self._last_seen_ea_heartbeat_at: datetime | None = None
@@ -60,18 +130,41 @@ class MainWindow(QMainWindow):
         self._build_ui()
         self._check_recovery_day()
 
-        # Polling timer — reads session.json periodically
+        # OS change notification — the watcher fires within milliseconds of
+        # an EA write instead of us re-reading session.json on a 2s timer.
+        self._bridge.read()  # make sure the file exists before watching it
+        self._session_watcher = QFileSystemWatcher(self)
+        self._session_watcher.addPath(self._bridge.path)
+        self._session_watcher.fileChanged.connect(self._on_session_file_changed)
+
+        # Low-frequency fallback for anything the watcher misses and for
+        # time-based transitions (break expiry, bias expiry, day rollover).
         self._poll_timer = QTimer(self)
-        self._poll_timer.setInterval(SESSION_POLL_INTERVAL_MS)
+        self._poll_timer.setInterval(SESSION_FALLBACK_POLL_INTERVAL_MS)
         self._poll_timer.timeout.connect(self._poll_session)
         self._poll_timer.start()
 
-        # MT5 guard timer — ensures terminal cannot be reopened after shutdown
-        # or on a mandatory recovery day.
-        self._mt5_guard_timer = QTimer(self)
-        self._mt5_guard_timer.setInterval(5000)  # 5 seconds
-        self._mt5_guard_timer.timeout.connect(self._guard_mt5_after_shutdown)
-        self._mt5_guard_timer.start()
+        # MT5 guard — a self-rescheduling single-shot chain instead of a
+        # fixed-interval timer: the next check is armed only after the
+        # current one (and any kill_mt5 subprocess) finishes, so ticks can
+        # never queue up, and the idle cadence relaxes to 30s.
+        QTimer.singleShot(_GUARD_INTERVAL_ACTIVE_MS, self._guard_tick)
+
+        # Bridge writes skip the per-write fsync; flush once a minute (and on
+        # close) so session.json survives a power cut without per-write cost.
+        self._bridge_flush_timer = QTimer(self)
+        self._bridge_flush_timer.setInterval(60_000)
+        self._bridge_flush_timer.timeout.connect(self._bridge.flush_to_disk)
+        self._bridge_flush_timer.start()
+
+    def closeEvent(self, event):
+        """Flush deferred bridge state before the window goes away."""
+        self._closing = True
+        self._db_thread.quit()
+        self._db_thread.wait(2000)
+        self._bridge.flush_to_disk()
+        self._bridge.close()
+        super().closeEvent(event)
 
     # ══════════════════════════════════════════════════════════════════════
     #  UI Construction
@@ -101,7 +194,6 @@ class MainWindow(QMainWindow):
         self._tabs.addTab(analysis_tab, "📊  Analysis")
 
         # ── Tab 2: Session ────────────────────────────────────────────────
-        from PyQt6.QtWidgets import QScrollArea
         session_tab = QWidget()
         session_scroll = QScrollArea()
         session_scroll.setWidgetResizable(True)
@@ -169,15 +261,13 @@ class MainWindow(QMainWindow):
         daily_title.setObjectName("subheading")
         daily_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         history_layout.addWidget(daily_title)
-        self._history_table = QTableWidget()
-        self._history_table.setColumnCount(4)
-        self._history_table.setHorizontalHeaderLabels(
-            ["Date", "P&L ($)", "Trades", "Result"]
-        )
+        self._history_model = DailyHistoryModel(self)
+        self._history_table = QTableView()
+        self._history_table.setModel(self._history_model)
         self._history_table.setMinimumHeight(220)
         self._history_table.horizontalHeader().setStretchLastSection(True)
         self._history_table.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers
+            QTableView.EditTrigger.NoEditTriggers
         )
         history_layout.addWidget(self._history_table)
 
@@ -240,7 +330,15 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage("Ready")
 
-        self._load_history()
+        # Defer the initial history load until the tab is first shown — it
+        # costs several queries plus three table fills before first paint.
+        self._history_loaded = False
+        self._tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _on_tab_changed(self, index: int) -> None:
+        """Load history lazily the first time its tab becomes visible."""
+        if not self._history_loaded and self._tabs.tabText(index).endswith("History"):
+            self._load_history()
 
     # ══════════════════════════════════════════════════════════════════════
     #  Session Lifecycle
@@ -294,8 +392,6 @@ class MainWindow(QMainWindow):
 
     def _start_session(self):
         """Called when 'Start Trading Session' is clicked."""
-        from app.config import is_within_trading_hours, get_tehran_time_str, TRADING_START_HOUR, TRADING_END_HOUR
-        
         if not self._timer_widget.is_complete():
             QMessageBox.information(
                 self,
@@ -403,7 +499,7 @@ class MainWindow(QMainWindow):
 
     def _shutdown_session(self):
         """Shared shutdown logic (manual or triggered by EA limits)."""
-        self._bridge.update(
+        data = self._bridge.update(
             session_active=False,
             trading_allowed=False,
             shutdown_signal=True,
@@ -413,7 +509,6 @@ class MainWindow(QMainWindow):
         self._shutdown_done = True
 
         # Record daily result
-        data = self._bridge.read()
         pnl = data.get("daily_profit_usd", 0) - data.get("daily_loss_usd", 0)
         trades = data.get("trades_today", 0)
         self._db.record_day(pnl=pnl, trades=trades)
@@ -424,10 +519,11 @@ class MainWindow(QMainWindow):
             context={"pnl": pnl, "trades_today": trades},
         )
 
+        self._db.checkpoint()
         self._load_history()
         self._status_bar.showMessage("Session ended — MT5 closed")
 
-    def _handle_consecutive_losses_shutdown(self, data: dict):
+    def _handle_consecutive_losses_shutdown(self, state: SessionState):
         """Handle shutdown triggered by consecutive losses - 1 hour break."""
         mt5_controller.kill_mt5()
         self._session_started = False
@@ -445,7 +541,7 @@ class MainWindow(QMainWindow):
             severity="critical",
             message="1-hour break enforced after consecutive losses.",
             context={
-                "consecutive_losses": int(data.get("consecutive_losses", 0) or 0),
+                "consecutive_losses": state.consecutive_losses,
                 "break_until": self._break_until.isoformat(),
             },
         )
@@ -513,39 +609,92 @@ class MainWindow(QMainWindow):
             "DEV: Today's lock reset — cooldown and break state cleared."
         )
 
+    def _rate_limited_kill_mt5(self) -> None:
+        """Issue kill_mt5 at most once per 5s.
+
+        The break-enforcement tick fires repeatedly while a block is
+        active; re-running taskkill for an already-dead terminal is just
+        process-spawn overhead.
+        """
+        now = time.monotonic()
+        if now - self._mt5_last_killed < 5.0:
+            return
+        self._mt5_last_killed = now
+        mt5_controller.kill_mt5()
+
+    def _guard_tick(self):
+        """Run one MT5 guard check, then arm the next one adaptively."""
+        if self._closing:
+            return
+        try:
+            self._guard_mt5_after_shutdown()
+        finally:
+            if not self._closing:
+                interval = (
+                    _GUARD_INTERVAL_IDLE_MS if self._guard_idle
+                    else _GUARD_INTERVAL_ACTIVE_MS
+                )
+                QTimer.singleShot(interval, self._guard_tick)
+
+    def _parse_break_until(self, raw: str) -> datetime | None:
+        """Parse break_until once per distinct string value."""
+        cached_raw, cached_dt = self._break_until_cache
+        if raw == cached_raw:
+            return cached_dt
+        try:
+            dt = datetime.fromisoformat(raw)
+        except ValueError:
+            dt = None
+        self._break_until_cache = (raw, dt)
+        return dt
+
     def _guard_mt5_after_shutdown(self):
         """Continuously enforce 'no reopening after shutdown', recovery days, 
         and 1-hour break after consecutive losses."""
-        
+
+        # Cheap change detection: when the previous tick concluded there was
+        # nothing to enforce (MT5 allowed) and neither the bridge file nor
+        # the wall-clock minute has moved, the full evaluation would reach
+        # the same conclusion — skip it. Ticks that enforced never skip.
+        try:
+            st = os.stat(self._bridge.path)
+            file_key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            file_key = None
+        tick_now = datetime.now()
+        guard_key = (file_key, tick_now.hour * 60 + tick_now.minute, self._shutdown_done)
+        if self._guard_idle and guard_key == self._last_guard_state:
+            return
+        self._last_guard_state = guard_key
+        self._guard_idle = False
+
         break_active = False
         break_reason = ""
         break_until_str = ""
         pre_session_block = False
         try:
-            data = self._bridge.read()
-            break_until_str = data.get("break_until") or ""
-            break_active = data.get("break_active", False)
+            state = SessionState.from_dict(self._bridge.read())
+            break_until_str = state.break_until
+            break_active = state.break_active
             pre_session_block = (
                 not self._timer_widget.is_complete()
-                and not bool(data.get("session_active"))
+                and not state.session_active
             )
             if break_until_str:
-                try:
-                    break_until = datetime.fromisoformat(break_until_str)
-                    if datetime.now() < break_until:
-                        break_reason = "1-hour break"
-                    else:
-                        break_active = False
-                except ValueError:
+                break_until = self._parse_break_until(break_until_str)
+                if break_until is None:
                     break_reason = ""
                     break_active = False
+                elif datetime.now() < break_until:
+                    break_reason = "1-hour break"
+                else:
+                    break_active = False
         except Exception as exc:
             log.warning("Error reading session in guard_mt5: %s", exc)
 
         recovery_day = self._db.is_recovery_day()
-        
+
         # Check daily break time
-        from app.config import is_daily_break_time, get_tehran_time_str
         daily_break, break_reason = is_daily_break_time()
         
         # Add daily break to the check
@@ -553,12 +702,14 @@ class MainWindow(QMainWindow):
             break_active = True
             break_reason = break_reason or "daily break"
         
-        log.debug(
-            "MT5 guard check: _shutdown_done=%s, recovery_day=%s, break_active=%s, pre_session_block=%s, break_reason='%s'",
-            self._shutdown_done, recovery_day, break_active, pre_session_block, break_reason
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "MT5 guard check: _shutdown_done=%s, recovery_day=%s, break_active=%s, pre_session_block=%s, break_reason='%s'",
+                self._shutdown_done, recovery_day, break_active, pre_session_block, break_reason
+            )
 
         if not self._shutdown_done and not recovery_day and not break_active and not pre_session_block:
+            self._guard_idle = True
             return
 
         if mt5_controller.is_mt5_running():
@@ -588,6 +739,17 @@ class MainWindow(QMainWindow):
     #  Polling
     # ══════════════════════════════════════════════════════════════════════
 
+    def _on_session_file_changed(self, path: str) -> None:
+        """Watcher slot: re-arm the watch and process the new state.
+
+        Writers that atomically replace the file (editors, some EAs) make
+        QFileSystemWatcher drop the path after reporting the change, so
+        re-add it before reading.
+        """
+        if path not in self._session_watcher.files():
+            self._session_watcher.addPath(path)
+        self._poll_session()
+
     def _poll_session(self):
         """Read session.json and update the Session widget.
         Also auto-shutdown if the EA signals it."""
@@ -602,6 +764,29 @@ class MainWindow(QMainWindow):
             self._violation_dedupe.clear()
             self._check_recovery_day()
 
+        # Idle short-circuit: if the file is unchanged since last tick and
+        # that tick saw a fully inactive session (no active session, break
+        # or shutdown in flight), no time-based transition can be pending —
+        # skip the read and the enforcement walk entirely.
+        try:
+            st = os.stat(self._bridge.path)
+            session_key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            session_key = None
+        if (
+            session_key is not None
+            and session_key == self._last_session_key
+            and self._last_poll_data is not None
+        ):
+            prev = self._last_poll_data
+            if not (
+                prev.get("session_active")
+                or prev.get("break_active")
+                or prev.get("shutdown_signal")
+            ):
+                return
+        self._last_session_key = session_key
+
         try:
             data = self._bridge.read()
         except Exception as exc:
@@ -616,28 +801,33 @@ class MainWindow(QMainWindow):
                 return
 
         data = self._sanitize_inactive_bridge_state(data)
-        self._update_active_session_tracking(data)
-        self._enforce_ea_presence(data)
-
-        self._session_widget.refresh(data)
-        self._sync_live_trade_events(data)
-        self._track_rule_state_transitions(data)
+        state = SessionState.from_dict(data)
+        self._update_active_session_tracking(state)
+        self._enforce_ea_presence(state)
+
+        # Skip the widget relayout and DB sync when the session state is
+        # identical to the previous tick (the common idle case). The
+        # time-based enforcement below still runs every tick.
+        if data != self._last_poll_data:
+            self._session_widget.refresh(data)
+            self._sync_live_trade_events(data)
+            self._track_rule_state_transitions(state)
+            self._last_poll_data = data
 
         # Enforce long break after consecutive losses (EA sets break_active).
-        self._enforce_break(data)
+        self._enforce_break(state)
 
         # Enforce bias expiry (Phase 3): after 2 hours or 3 losses since bias
         # was set, disable trading until the user updates their bias again.
-        self._enforce_bias_expiry(data)
+        self._enforce_bias_expiry(state)
 
         # Auto-shutdown if EA sets shutdown_signal
-        shutdown_signal = bool(data.get("shutdown_signal"))
         is_current_session_day = self._is_bridge_data_for_current_session_day(data)
-        if shutdown_signal and not self._shutdown_done and is_current_session_day:
+        if state.shutdown_signal and not self._shutdown_done and is_current_session_day:
             # Check if this is a consecutive losses shutdown (has break_active)
-            if data.get("break_active"):
+            if state.break_active:
                 # Consecutive losses: record result and start 1-hour break
-                self._handle_consecutive_losses_shutdown(data)
+                self._handle_consecutive_losses_shutdown(state)
             else:
                 # Full daily shutdown (limits reached)
                 self._shutdown_session()
@@ -645,7 +835,7 @@ class MainWindow(QMainWindow):
                     "🛑  AUTO-SHUTDOWN — daily limit reached"
                 )
 
-        elif shutdown_signal and not is_current_session_day:
+        elif state.shutdown_signal and not is_current_session_day:
             log.info("Ignoring stale shutdown_signal from previous session day.")
             try:
                 self._bridge.update(shutdown_signal=False)
@@ -678,8 +868,8 @@ class MainWindow(QMainWindow):
             except ValueError:
                 return None
 
-    def _update_active_session_tracking(self, data: dict) -> None:
-        if bool(data.get("session_active")):
+    def _update_active_session_tracking(self, state: SessionState) -> None:
+        if state.session_active:
             if self._active_session_since is None:
                 self._active_session_since = datetime.now()
         else:
@@ -687,15 +877,15 @@ class MainWindow(QMainWindow):
             self._last_seen_ea_heartbeat = ""
             self._last_seen_ea_heartbeat_at = None
 
-    def _enforce_ea_presence(self, data: dict) -> None:
+    def _enforce_ea_presence(self, state: SessionState) -> None:
         """Kill MT5 if EA heartbeat disappears during an active session."""
-        if not bool(data.get("session_active")):
+        if not state.session_active:
             return
         if not mt5_controller.is_mt5_running():
             return
 
         now = datetime.now()
-        heartbeat_raw = (data.get("ea_heartbeat") or "").strip()
+        heartbeat_raw = state.ea_heartbeat
         if heartbeat_raw:
             if heartbeat_raw != self._last_seen_ea_heartbeat:
                 self._last_seen_ea_heartbeat = heartbeat_raw
@@ -747,7 +937,7 @@ class MainWindow(QMainWindow):
             return data
 
         try:
-            self._bridge.update(
+            cleaned = self._bridge.update(
                 session_active=False,
                 trading_allowed=False,
                 shutdown_signal=False,
@@ -762,7 +952,6 @@ class MainWindow(QMainWindow):
                 consecutive_losses=0,
                 losses_since_bias=0,
             )
-            cleaned = self._bridge.read()
             log.warning("Cleared stale inactive bridge counters for new session day.")
             return cleaned
         except Exception as exc:
@@ -854,13 +1043,13 @@ class MainWindow(QMainWindow):
         except Exception as exc:
             log.warning("Failed to record violation: %s", exc)
 
-    def _track_rule_state_transitions(self, data: dict) -> None:
+    def _track_rule_state_transitions(self, state: SessionState) -> None:
         """Record key session-rule transitions as violation/audit events."""
-        shutdown_signal = bool(data.get("shutdown_signal"))
-        break_active = bool(data.get("break_active"))
-        bias_expired = bool(data.get("bias_expired"))
-        news_lock = bool(data.get("news_lock"))
-        trade_idx = int(data.get("trades_today", 0) or 0) or None
+        shutdown_signal = state.shutdown_signal
+        break_active = state.break_active
+        bias_expired = state.bias_expired
+        news_lock = state.news_lock
+        trade_idx = state.trades_today or None
 
         if shutdown_signal and not self._prev_shutdown_signal:
             self._record_violation(
@@ -868,7 +1057,7 @@ class MainWindow(QMainWindow):
                 severity="critical",
                 message="EA signaled session shutdown.",
                 trade_index=trade_idx,
-                context={"trading_allowed": bool(data.get("trading_allowed"))},
+                context={"trading_allowed": state.trading_allowed},
                 dedupe_key=f"shutdown:{get_session_day_str()}",
             )
         if break_active and not self._prev_break_active:
@@ -877,7 +1066,7 @@ class MainWindow(QMainWindow):
                 severity="critical",
                 message="Break state became active.",
                 trade_index=trade_idx,
-                context={"break_until": data.get("break_until", "")},
+                context={"break_until": state.break_until},
                 dedupe_key=f"break:{get_session_day_str()}",
             )
         if bias_expired and not self._prev_bias_expired:
@@ -886,7 +1075,7 @@ class MainWindow(QMainWindow):
                 severity="warn",
                 message="Bias expired flag received from session.",
                 trade_index=trade_idx,
-                context={"losses_since_bias": int(data.get("losses_since_bias", 0) or 0)},
+                context={"losses_since_bias": state.losses_since_bias},
                 dedupe_key=f"bias_expired:{get_session_day_str()}",
             )
         if news_lock and not self._prev_news_lock:
@@ -904,7 +1093,7 @@ class MainWindow(QMainWindow):
         self._prev_bias_expired = bias_expired
         self._prev_news_lock = news_lock
 
-    def _enforce_break(self, data: dict) -> None:
+    def _enforce_break(self, state: SessionState) -> None:
         """Keep MT5 closed for one hour after N consecutive losses.
 
         EA sets break_active=True and trading_allowed=False. Here we:
@@ -913,11 +1102,11 @@ class MainWindow(QMainWindow):
         - When the hour has passed, clear break_active/break_until and
           re-enable trading (unless other shutdown rules apply).
         """
-        if not data.get("break_active"):
+        if not state.break_active:
             return
 
         # Initialise break_until if missing
-        break_until_str = data.get("break_until") or ""
+        break_until_str = state.break_until
         now = datetime.now()
 
         if not break_until_str:
@@ -926,12 +1115,11 @@ class MainWindow(QMainWindow):
             self._status_bar.showMessage(
                 "🛑  1-hour break started after consecutive losses."
             )
-            mt5_controller.kill_mt5()
+            self._rate_limited_kill_mt5()
             return
 
-        try:
-            break_until = datetime.fromisoformat(break_until_str)
-        except ValueError:
+        break_until = self._parse_break_until(break_until_str)
+        if break_until is None:
             # If parsing fails, reset the break to be safe.
             until = now + timedelta(hours=1)
             self._bridge.update(break_until=until.isoformat())
@@ -939,7 +1127,7 @@ class MainWindow(QMainWindow):
 
         if now < break_until:
             # Still in break window — keep MT5 closed.
-            mt5_controller.kill_mt5()
+            self._rate_limited_kill_mt5()
             return
 
         # Break period finished — clear flags and re-enable trading.
@@ -952,7 +1140,7 @@ class MainWindow(QMainWindow):
             "✅  1-hour break finished — trading re-enabled for this session."
         )
 
-    def _enforce_bias_expiry(self, data: dict) -> None:
+    def _enforce_bias_expiry(self, state: SessionState) -> None:
         """Disable trading when bias has expired by time or losses.
 
         Rules:
@@ -961,13 +1149,13 @@ class MainWindow(QMainWindow):
         - Updating the bias (via BiasWidget) clears bias_expired and
           re-enables trading for the current session.
         """
-        if not data.get("session_active"):
+        if not state.session_active:
             return
-        if data.get("shutdown_signal"):
+        if state.shutdown_signal:
             # Full daily shutdown already in effect; do not interfere.
             return
 
-        bias_set_at = data.get("bias_set_at") or ""
+        bias_set_at = state.bias_set_at
         if not bias_set_at:
             return
 
@@ -978,8 +1166,8 @@ class MainWindow(QMainWindow):
 
         now = datetime.now()
         age = now - bias_time
-        losses_since_bias = int(data.get("losses_since_bias", 0) or 0)
-        expired = bool(data.get("bias_expired"))
+        losses_since_bias = state.losses_since_bias
+        expired = state.bias_expired
 
         if expired:
             return
@@ -1036,49 +1224,55 @@ class MainWindow(QMainWindow):
             lbl.setText(value)
 
     def _load_history(self):
-        stats = self._db.get_overview_stats(days=30)
-        self._set_perf_value("total_pnl", f"${stats['total_pnl']:+.2f}")
+        """Request an asynchronous History refresh from the worker thread."""
+        self._history_loaded = True
+        self._history_refresh_requested.emit()
+
+    def _populate_history(self, stats: dict, rows: list, trades: list, violations: list):
+        """Fill the History tab from worker-thread query results."""
+        self._set_perf_value("total_pnl", _FMT_PNL(stats["total_pnl"]))
         self._set_perf_value("win_rate", f"{stats['win_rate']:.1f}%")
         self._set_perf_value("wins_losses", f"{stats['wins']} / {stats['losses']}")
         self._set_perf_value("total_trades", str(stats["total_trades"]))
         self._set_perf_value("green_red_days", f"{stats['green_days']} / {stats['red_days']}")
         self._set_perf_value("breakeven", str(stats["breakeven"]))
 
-        rows = self._db.get_last_n_days(30)
-        self._history_table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            self._history_table.setItem(i, 0, QTableWidgetItem(row["date"]))
-            pnl_item = QTableWidgetItem(f"${row['pnl']:+.2f}")
-            self._history_table.setItem(i, 1, pnl_item)
-            self._history_table.setItem(
-                i, 2, QTableWidgetItem(str(row["trades"]))
-            )
-            result_item = QTableWidgetItem(row["result"].upper())
-            self._history_table.setItem(i, 3, result_item)
+        self._history_model.set_rows(rows)
 
-        trades = self._db.get_trade_ledger(limit=150)
+        # Suspend painting while the grid fills: one repaint at the end
+        # instead of relayout churn per cell.
+        self._trade_table.setUpdatesEnabled(False)
         self._trade_table.setRowCount(len(trades))
         for i, t in enumerate(trades):
             self._trade_table.setItem(i, 0, QTableWidgetItem(t["trade_date"]))
             self._trade_table.setItem(i, 1, QTableWidgetItem(str(t["trade_index"])))
-            self._trade_table.setItem(i, 2, QTableWidgetItem((t["result"] or "unknown").upper()))
+            result = t["result"] or "unknown"
+            self._trade_table.setItem(
+                i, 2, QTableWidgetItem(_TRADE_RESULT_UPPER.get(result, result.upper()))
+            )
             pnl_val = t.get("pnl")
-            pnl_text = "—" if pnl_val is None else f"${float(pnl_val):+.2f}"
+            pnl_text = "—" if pnl_val is None else _FMT_PNL(float(pnl_val))
             self._trade_table.setItem(i, 3, QTableWidgetItem(pnl_text))
             self._trade_table.setItem(i, 4, QTableWidgetItem(t.get("close_reason") or ""))
             self._trade_table.setItem(i, 5, QTableWidgetItem(t.get("source") or ""))
             self._trade_table.setItem(i, 6, QTableWidgetItem(t["recorded_at"]))
 
-        violations = self._db.get_violation_log(limit=150)
+        self._trade_table.setUpdatesEnabled(True)
+
+        self._violation_table.setUpdatesEnabled(False)
         self._violation_table.setRowCount(len(violations))
         for i, v in enumerate(violations):
             self._violation_table.setItem(i, 0, QTableWidgetItem(v["event_time"]))
             self._violation_table.setItem(i, 1, QTableWidgetItem(v["rule_code"]))
-            self._violation_table.setItem(i, 2, QTableWidgetItem((v.get("severity") or "warn").upper()))
+            severity = v.get("severity") or "warn"
+            self._violation_table.setItem(
+                i, 2, QTableWidgetItem(_SEVERITY_UPPER.get(severity, severity.upper()))
+            )
             trade_idx = "-" if v.get("trade_index") is None else str(v.get("trade_index"))
             self._violation_table.setItem(i, 3, QTableWidgetItem(trade_idx))
             self._violation_table.setItem(i, 4, QTableWidgetItem(v.get("trade_date") or ""))
             self._violation_table.setItem(i, 5, QTableWidgetItem(v.get("message") or ""))
+        self._violation_table.setUpdatesEnabled(True)
 
         if hasattr(self, "_trade_analysis_widget"):
             self._trade_analysis_widget.refresh_trades()
@@ -1140,7 +1334,11 @@ class MainWindow(QMainWindow):
                 return
 
             # Backfill any missed entries. Older gaps are unknown because only
-            # the latest close payload is available in session.json.
+            # the latest close payload is available in session.json. Buffer
+            # the rows and write each table once so a multi-trade backfill
+            # costs two transactions instead of two per trade.
+            event_rows = []
+            ledger_rows = []
             for idx in range(db_last_index + 1, current_trades + 1):
                 result = "unknown"
                 pnl_delta = None
@@ -1157,21 +1355,12 @@ class MainWindow(QMainWindow):
                     ):
                         pnl_delta = net_pnl - self._prev_net_pnl
 
-                self._db.record_trade_event(
-                    trade_index=idx,
-                    result=result,
-                    pnl=pnl_delta,
-                    trade_day=today,
-                )
                 close_reason = "sync_backfill" if idx < current_trades else "session_update"
-                self._db.record_trade_ledger(
-                    trade_index=idx,
-                    result=result,
-                    pnl=pnl_delta,
-                    close_reason=close_reason,
-                    source="bridge",
-                    trade_day=today,
-                )
+                event_rows.append((today, idx, result, pnl_delta))
+                ledger_rows.append((today, idx, result, pnl_delta, close_reason, "bridge"))
+
+            self._db.record_trade_events_bulk(event_rows)
+            self._db.record_trade_ledger_bulk(ledger_rows)
 
             self._load_history()
             self._prev_trades_today = current_trades